@@ -13,8 +13,29 @@ except ImportError as e:
     print("Please install: pip install Pillow")
     exit(1)
 
-def create_p_icon(size, output_path):
-    """Create a simple 'P' icon with star cutout"""
+# Size of the master icon every output size is downscaled from
+MASTER_SIZE = 1024
+
+# Smallest output size that shows the star; below it the star would shrink to
+# a smudge, so those sizes come from a master drawn without it
+STAR_MIN_SIZE = 32
+
+def _compute_star_points(size):
+    """Return the star polygon vertices for an icon of the given size"""
+    star_size = max(4, size // 10)
+    star_x = size - star_size * 2
+    star_y = star_size
+    return [
+        (star_x, star_y - star_size//2),  # top
+        (star_x + star_size//4, star_y),  # right-mid
+        (star_x + star_size//2, star_y + star_size//2),  # right-bottom
+        (star_x, star_y + star_size//4),  # bottom-mid
+        (star_x - star_size//2, star_y + star_size//2),  # left-bottom
+        (star_x - star_size//4, star_y),  # left-mid
+    ]
+
+def create_p_icon(size=MASTER_SIZE, star=True):
+    """Draw a simple 'P' icon, with a star cutout if star, and return it as a PIL image"""
     # Create image with navy blue background
     img = Image.new('RGB', (size, size), '#003366')
     draw = ImageDraw.Draw(img)
@@ -54,24 +75,14 @@ def create_p_icon(size, output_path):
     ], fill='#003366')
 
     # Draw small star in top-right (simplified)
-    star_size = max(4, size // 10)
-    star_x = size - star_size * 2
-    star_y = star_size
+    if star and size >= STAR_MIN_SIZE:
+        draw.polygon(_compute_star_points(size), fill='#F8F9FA')
+
+    return img
 
-    # Simple star as diamond/square for small sizes
-    if size >= 32:
-        # Draw a small star shape
-        star_points = [
-            (star_x, star_y - star_size//2),  # top
-            (star_x + star_size//4, star_y),  # right-mid
-            (star_x + star_size//2, star_y + star_size//2),  # right-bottom
-            (star_x, star_y + star_size//4),  # bottom-mid
-            (star_x - star_size//2, star_y + star_size//2),  # left-bottom
-            (star_x - star_size//4, star_y),  # left-mid
-        ]
-        draw.polygon(star_points, fill='#F8F9FA')
-
-    # Save
+def resize_and_save(master, size, output_path):
+    """Downscale the master icon to size x size and save it as PNG"""
+    img = master.resize((size, size), Image.LANCZOS)
     img.save(output_path, 'PNG')
     print(f"✓ Generated: {output_path.name} ({size}x{size})")
     return img
@@ -98,12 +109,20 @@ def main():
         'apple-touch-icon.png': 180,
     }
 
+    # Draw the icon once at high resolution; every size is resized from it,
+    # or from the starless master below STAR_MIN_SIZE
+    master = create_p_icon(MASTER_SIZE)
+    starless_master = create_p_icon(MASTER_SIZE, star=False)
+
+    def master_for(size):
+        return master if size >= STAR_MIN_SIZE else starless_master
+
     # Generate PNG files
     print("Generating PNG files...")
     images = {}
     for filename, size in sizes_to_generate.items():
         output_path = favicon_dir / filename
-        img = create_p_icon(size, output_path)
+        img = resize_and_save(master_for(size), size, output_path)
         images[size] = img
 
     print()
@@ -112,26 +131,17 @@ def main():
     print("Generating .ico file...")
     ico_path = favicon_dir / 'favicon.ico'
     ico_sizes = [16, 32, 48]
-    ico_images = []
-
-    for size in ico_sizes:
-        img = create_p_icon(size, favicon_dir / f'temp_{size}.png')
-        ico_images.append(img)
-
-    # Save as .ico
-    if ico_images:
-        ico_images[0].save(
-            ico_path,
-            format='ICO',
-            sizes=[(img.size[0], img.size[1]) for img in ico_images]
-        )
-        print(f"✓ Generated: {ico_path.name} (multi-size)")
-
-        # Clean up temporary files
-        for size in ico_sizes:
-            temp_file = favicon_dir / f'temp_{size}.png'
-            if temp_file.exists():
-                temp_file.unlink()
+
+    # Each frame is resized in memory from its master, so no temporary
+    # per-size PNGs are needed; Pillow picks the frame matching each size
+    ico_images = [master_for(size).resize((size, size), Image.LANCZOS) for size in ico_sizes]
+    ico_images[-1].save(
+        ico_path,
+        format='ICO',
+        sizes=[(size, size) for size in ico_sizes],
+        append_images=ico_images[:-1]
+    )
+    print(f"✓ Generated: {ico_path.name} (multi-size)")
 
     print()
     print("============================================================")
@@ -33,17 +33,39 @@ Color System:
 
 Usage:
     python generator.py
+    python generator.py --no-cache   # Ignore the Parquet cache of parsed CSVs
+    python generator.py --verbose    # Print every generated page
+    python generator.py --workers 1  # Render transaction pages in this process
+    python generator.py --full       # Regenerate pages even if their inputs are unchanged
+    PERMITINDEX_JINJA_CACHE=0 python generator.py   # Don't cache compiled templates
+    PERMITINDEX_VERBOSE=1 python generator.py       # Same as --verbose
 """
 
 import os
+import argparse
+import csv
 import json
 import glob
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
-from jinja2 import Environment, FileSystemLoader
-from datetime import datetime
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from datetime import date, datetime
+from operator import itemgetter
+from types import SimpleNamespace
 import sys
 import re
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None  # Optional: faster CSV parsing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: faster data.json serialization
+
 
 # Required columns for all CSV files
 REQUIRED_COLUMNS = [
@@ -57,6 +79,265 @@ REQUIRED_COLUMNS = [
     'api_available'
 ]
 
+# Low-cardinality columns stored as pandas categoricals once all files are
+# combined (CSV files are parsed separately, and concatenating categoricals
+# with different categories would fall back to object dtype)
+CATEGORY_COLUMNS = [
+    'agency_short',
+    'agency_full',
+    'online_available',
+    'api_available',
+    'mcp_available',
+    'source_file'
+]
+
+# Map common state abbreviations (first word of agency_short) to URL slugs
+STATE_MAP = {
+    'CA': 'california',
+    'NY': 'new-york',
+    'TX': 'texas',
+    'FL': 'florida',
+    # Add more as needed
+}
+
+# Precompiled patterns for slugs, numbered steps and volume parsing
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_SPACE = re.compile(r'[\s_]+')
+_SLUG_TRIM = re.compile(r'^-+|-+$')
+_NUM_STEP_SPLIT = re.compile(r'\s+\d+\.\s+')
+_LEAD_NUM = re.compile(r'^\d+\.\s*')
+_HAS_DIGIT = re.compile(r'\d')
+_VOLUME_RE = re.compile(r'(\d+)')
+
+# Transaction pages are rendered in a process pool once a build has at least
+# this many of them; below that, worker start-up costs more than it saves
+PARALLEL_MIN_PAGES = 500
+
+# Templates rendered by a full build, compiled once up front
+PAGE_TEMPLATES = ('index.html', 'jurisdiction_hub.html', 'transaction_page.html')
+
+# Number of pages sent to a worker process per task
+RENDER_BATCH_SIZE = 500
+
+# Write buffer for generated pages, large enough to hold a typical page
+PAGE_WRITE_BUFFER = 1 << 16
+
+# Write buffer for the site-wide files that grow with the permit count
+# (sitemap.xml, data.json)
+OUTPUT_WRITE_BUFFER = 1 << 20
+
+# Input hashes of the pages written by the previous build, kept in the output
+# directory so pages whose template and data are unchanged can be skipped
+PAGE_HASHES_FILE = '.page_hashes.json'
+
+# sitemap.xml building blocks
+SITEMAP_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+)
+SITEMAP_URL_TEMPLATE = (
+    '  <url>\n'
+    '    <loc>{loc}</loc>\n'
+    '    <lastmod>{lastmod}</lastmod>\n'
+    '    <changefreq>{changefreq}</changefreq>\n'
+    '    <priority>{priority}</priority>\n'
+    '  </url>'
+)
+SITEMAP_FOOTER = '</urlset>'
+
+# Base URL for the site
+SITE_URL = "https://permitindex.com"
+
+
+# Cells pandas' CSV parsers read as NaN by default (pandas' STR_NA_VALUES);
+# polars is given the same list, as it otherwise only treats empty cells as null
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null',
+]
+
+
+def _normalize_values(df):
+    """
+    Make polars/pyarrow-parsed values match what pandas' C engine returns
+
+    ISO dates stay strings and empty cells are NaN, so downstream code sees
+    the same values whichever parser (or the Parquet cache) produced them.
+
+    Args:
+        df: pandas DataFrame
+
+    Returns:
+        The same DataFrame, normalized in place
+    """
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        values = df[col]
+        # pyarrow infers ISO date columns (e.g. date_extracted) as datetime.date
+        if any(isinstance(v, date) for v in values):
+            values = values.map(lambda v: v.isoformat() if isinstance(v, date) else v)
+        # polars/pyarrow return None for empty string cells; the C engine returns NaN
+        df[col] = values.where(values.notna(), float('nan'))
+
+    return df
+
+
+def read_csv(csv_path, use_cache=False):
+    """
+    Read a CSV file with the fastest parser available
+
+    Prefers polars (multithreaded Rust reader), then pandas' pyarrow engine,
+    then the default C engine.
+
+    With use_cache, the parsed DataFrame is also saved next to the CSV as
+    '<file>.csv.cache.parquet' and reused while it is newer than the CSV.
+    Caching is skipped silently when pyarrow isn't installed.
+
+    Args:
+        csv_path: Path to the CSV file
+        use_cache: Read/write the Parquet cache
+
+    Returns:
+        pandas DataFrame
+    """
+    parquet_path = csv_path + '.cache.parquet'
+    if use_cache and os.path.exists(parquet_path) \
+            and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        try:
+            return _normalize_values(pd.read_parquet(parquet_path))
+        except (ImportError, OSError, ValueError):
+            pass  # Missing pyarrow or unreadable cache; parse the CSV instead
+
+    df = None
+    if pl is not None:
+        try:
+            df = pl.read_csv(csv_path, infer_schema_length=None,
+                             null_values=CSV_NA_VALUES).to_pandas()
+        except ImportError:
+            pass  # DataFrame.to_pandas() needs pyarrow
+
+    if df is None:
+        try:
+            df = pd.read_csv(csv_path, engine='pyarrow')
+        except ImportError:
+            df = pd.read_csv(csv_path)
+
+    df = _normalize_values(df)
+
+    if use_cache:
+        try:
+            df.to_parquet(parquet_path, compression='zstd')
+        except (ImportError, OSError, TypeError, ValueError):
+            pass  # Caching is best-effort (e.g. mixed-type columns)
+
+    return df
+
+
+def _parse_json_field(value, field):
+    """Parse a JSON-encoded CSV cell, returning [] if it is not valid JSON"""
+    try:
+        return orjson.loads(value) if orjson is not None else json.loads(value)
+    except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError
+        print(f"⚠️  Warning: Could not parse JSON for {field}")
+        return []
+
+
+def _hash_templates(templates_dir):
+    """Hash the name and contents of every file in the templates directory"""
+    digest = hashlib.blake2b(digest_size=16)
+    for root, dirs, files in sorted(os.walk(templates_dir)):
+        dirs.sort()
+        for filename in sorted(files):
+            path = os.path.join(root, filename)
+            digest.update(os.path.relpath(path, templates_dir).encode('utf-8'))
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.digest()
+
+
+def _json_bytes(obj):
+    """Serialize obj as compact UTF-8 JSON (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def create_environment(templates_dir, cache_dir=None):
+    """
+    Create the Jinja2 environment used to render all pages
+
+    Templates never change during a build, so auto-reload (a stat() per
+    template lookup) is off and the template cache is unbounded. Templates
+    are trusted, so autoescape stays off; trim_blocks/lstrip_blocks drop the
+    whitespace around block tags at compile time.
+
+    Args:
+        templates_dir: Directory containing the Jinja2 templates
+        cache_dir: Optional directory for compiled template bytecode,
+                   reused across runs to skip recompiling templates
+
+    Returns:
+        jinja2.Environment
+    """
+    bytecode_cache = None
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(directory=cache_dir)
+
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=False,
+        optimized=True,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=bytecode_cache
+    )
+
+
+def _write_page(template, data, output_path):
+    """
+    Render a template and write it to output_path in one pass
+
+    Chunks are encoded and written as they are produced instead of building
+    the whole page string first.
+    """
+    with open(output_path, 'wb', buffering=PAGE_WRITE_BUFFER) as f:
+        template.stream(**data).dump(f, encoding='utf-8')
+
+
+# Compiled template for the current render worker process
+_worker_template = None
+
+
+def _init_render_worker(templates_dir, cache_dir, template_name):
+    """Process pool initializer: load the page template once per worker"""
+    global _worker_template
+    _worker_template = create_environment(templates_dir, cache_dir).get_template(template_name)
+
+
+def _render_batch(batch):
+    """
+    Render and write a batch of pages in a worker process
+
+    Args:
+        batch: List of (data, output_path) tuples
+
+    Returns:
+        List of (output_path, error) tuples; error is None on success
+    """
+    results = []
+    for data, output_path in batch:
+        try:
+            _write_page(_worker_template, data, output_path)
+            results.append((output_path, None))
+        except Exception as e:
+            results.append((output_path, str(e)))
+    return results
+
 
 class DataValidator:
     """Validates data consistency across multiple CSV files"""
@@ -152,25 +433,45 @@ class DataValidator:
 class SiteGenerator:
     """Main site generator class with multi-CSV support"""
 
-    def __init__(self, base_dir=None):
+    def __init__(self, base_dir=None, workers=None, use_cache=True, verbose=False,
+                 incremental=True):
         """
         Initialize the site generator
 
         Args:
             base_dir: Base directory path (defaults to script location)
+            workers: Processes used to render transaction pages
+                     (defaults to the CPU count; 1 disables the process pool)
+            use_cache: Reuse parsed CSVs from their Parquet cache files
+            verbose: Print a line for every generated page
+                     (also enabled by PERMITINDEX_VERBOSE=1)
+            incremental: Skip pages whose template and data are unchanged
+                         since the previous build
         """
         self.base_dir = base_dir or os.path.dirname(os.path.abspath(__file__))
         self.templates_dir = os.path.join(self.base_dir, 'templates')
         self.data_dir = os.path.join(self.base_dir, 'data')
         self.output_dir = os.path.join(self.base_dir, 'output')
         self.static_dir = os.path.join(self.base_dir, 'static')
+        # Compiled template bytecode is cached across runs unless
+        # PERMITINDEX_JINJA_CACHE=0 is set
+        if os.environ.get('PERMITINDEX_JINJA_CACHE', '1') == '0':
+            self.jinja_cache_dir = None
+        else:
+            self.jinja_cache_dir = os.path.join(self.base_dir, '.jinja_cache')
+        self.workers = workers or os.cpu_count() or 1
+        self.use_cache = use_cache
+        # PERMITINDEX_VERBOSE=1 turns on per-page output without the CLI flag
+        self.verbose = verbose or os.environ.get('PERMITINDEX_VERBOSE', '0') == '1'
+        self.incremental = incremental
 
         # Initialize Jinja2 environment
-        self.env = Environment(loader=FileSystemLoader(self.templates_dir))
+        self.env = create_environment(self.templates_dir, self.jinja_cache_dir)
 
         # Statistics
         self.stats = {
             'pages_generated': 0,
+            'pages_skipped': 0,
             'errors': 0,
             'start_time': datetime.now(),
             'files_loaded': 0
@@ -179,6 +480,21 @@ class SiteGenerator:
         # Data validator
         self.validator = DataValidator()
 
+        # Parsed CSV cache, keyed by filename (each file is read once per build)
+        self._cache = {}
+
+        # Compiled Jinja2 templates, keyed by template name
+        self._templates = {}
+
+        # Output directories already created during this build
+        self._created_dirs = set()
+
+        # Page input hashes from the previous build (loaded on first use) and
+        # for the pages of this build, keyed by path relative to output_dir
+        self._templates_hash = None
+        self._previous_page_hashes = None
+        self._page_hashes = {}
+
     def slugify(self, text):
         """
         Convert text to URL-safe slug
@@ -192,9 +508,9 @@ class SiteGenerator:
         # Convert to lowercase
         text = text.lower()
         # Remove special characters and replace spaces with hyphens
-        text = re.sub(r'[^\w\s-]', '', text)
-        text = re.sub(r'[\s_]+', '-', text)
-        text = re.sub(r'^-+|-+$', '', text)
+        text = _SLUG_STRIP.sub('', text)
+        text = _SLUG_SPACE.sub('-', text)
+        text = _SLUG_TRIM.sub('', text)
         return text
 
     def generate_url_slug(self, agency_short, request_type):
@@ -211,16 +527,7 @@ class SiteGenerator:
         # Extract state/jurisdiction from agency name (e.g., "CA" -> "california")
         state_abbrev = agency_short.split()[0] if agency_short else ""
 
-        # Map common state abbreviations to full names
-        state_map = {
-            'CA': 'california',
-            'NY': 'new-york',
-            'TX': 'texas',
-            'FL': 'florida',
-            # Add more as needed
-        }
-
-        state_slug = state_map.get(state_abbrev, self.slugify(state_abbrev))
+        state_slug = STATE_MAP.get(state_abbrev) or self.slugify(state_abbrev)
 
         # Slugify request type
         request_slug = self.slugify(request_type)
@@ -228,6 +535,55 @@ class SiteGenerator:
         # Combine: state-request-type
         return f"{state_slug}-{request_slug}"
 
+    def slugify_series(self, series):
+        """
+        Vectorized slugify() over a pandas Series of strings
+
+        Args:
+            series: pandas Series of text values
+
+        Returns:
+            pandas Series of URL-safe slugs
+        """
+        return (series.str.lower()
+                .str.replace(_SLUG_STRIP, '', regex=True)
+                .str.replace(_SLUG_SPACE, '-', regex=True)
+                .str.replace(_SLUG_TRIM, '', regex=True))
+
+    def add_slug_columns(self, df):
+        """
+        Add jurisdiction_slug, permit_slug and _volume_num columns to the DataFrame
+
+        Slugs are computed once per build with pandas string operations
+        instead of calling slugify() per row in every generator.
+        _volume_num is the first number in estimated_monthly_volume
+        (e.g., '800-1200' -> 800, 0 if there is none), used to rank permits.
+        Does nothing if the columns already exist.
+
+        Args:
+            df: DataFrame with permit data
+
+        Returns:
+            The same DataFrame, with derived columns added
+        """
+        if all(col in df.columns for col in ('jurisdiction_slug', 'permit_slug', '_volume_num')):
+            return df
+
+        # Extract state/jurisdiction from agency name (e.g., "CA" -> "california")
+        state_abbrev = df['agency_short'].astype(object).fillna('').str.split().str[0].fillna('')
+        df['jurisdiction_slug'] = state_abbrev.map(STATE_MAP).fillna(self.slugify_series(state_abbrev))
+
+        # Clean permit slug (just the permit name, not state-permit)
+        df['permit_slug'] = self.slugify_series(df['request_type'])
+
+        if 'estimated_monthly_volume' in df.columns:
+            df['_volume_num'] = (df['estimated_monthly_volume'].astype(str)
+                                 .str.extract(_VOLUME_RE, expand=False).fillna('0').astype(int))
+        else:
+            df['_volume_num'] = 0
+
+        return df
+
     def load_all_csv_files(self):
         """
         Load and validate all CSV files from data directory
@@ -257,7 +613,7 @@ class SiteGenerator:
 
             try:
                 # Read CSV
-                df = pd.read_csv(csv_file)
+                df = read_csv(csv_file, use_cache=self.use_cache)
                 print(f"  - Rows: {len(df)}")
 
                 # Validate
@@ -294,6 +650,12 @@ class SiteGenerator:
         column_order = REQUIRED_COLUMNS + sorted(extra_cols) + ['source_file']
         combined_df = combined_df[column_order]
 
+        # Store repeated values as category codes: smaller frame, faster
+        # groupby/nunique and equality masks
+        for col in CATEGORY_COLUMNS:
+            if col in combined_df.columns:
+                combined_df[col] = combined_df[col].astype('category')
+
         print(f"\n✅ Combined {len(combined_df)} total records from {self.stats['files_loaded']} file(s)")
 
         return combined_df
@@ -314,9 +676,13 @@ class SiteGenerator:
             csv_path = os.path.join(self.data_dir, csv_file)
             print(f"📂 Loading data from: {csv_path}")
 
+            if csv_file in self._cache:
+                return self._cache[csv_file]
+
             try:
-                df = pd.read_csv(csv_path)
+                df = read_csv(csv_path, use_cache=self.use_cache)
                 print(f"✓ Loaded {len(df)} records")
+                self._cache[csv_file] = df
                 return df
             except FileNotFoundError:
                 print(f"✗ Error: CSV file not found: {csv_path}")
@@ -328,30 +694,61 @@ class SiteGenerator:
             # New multi-file mode
             return self.load_all_csv_files()
 
-    def generate_page(self, template_name, data, output_path):
+    def get_template(self, template_name):
         """
-        Generate a single HTML page from template and data
+        Get a compiled Jinja2 template, loading it only on first use
 
         Args:
             template_name: Name of the Jinja2 template
+
+        Returns:
+            jinja2.Template
+        """
+        if template_name not in self._templates:
+            self._templates[template_name] = self.env.get_template(template_name)
+        return self._templates[template_name]
+
+    def ensure_directory(self, directory):
+        """
+        Create an output directory once per build
+
+        Args:
+            directory: Directory path to create if needed
+        """
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
+    def generate_page(self, template, data, output_path):
+        """
+        Generate a single HTML page from template and data
+
+        Args:
+            template: Compiled Jinja2 template (or template name)
             data: Dictionary of data to pass to template
             output_path: Full path where to save the generated HTML
         """
         try:
-            # Load template
-            template = self.env.get_template(template_name)
+            if isinstance(template, str):
+                template = self.get_template(template)
 
-            # Render template with data
-            html_content = template.render(**data)
+            # Skip the page if its template and data match the previous build
+            fingerprint = self.page_fingerprint(template.name, data, output_path)
+            if fingerprint and self.page_is_unchanged(fingerprint, output_path):
+                self._page_hashes.update([fingerprint])
+                self.stats['pages_skipped'] += 1
+                return
 
             # Ensure output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            self.ensure_directory(os.path.dirname(output_path))
 
-            # Write HTML file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # Render and write in one pass
+            _write_page(template, data, output_path)
 
-            print(f"✓ Generated: {output_path}")
+            if fingerprint:
+                self._page_hashes.update([fingerprint])
+            if self.verbose:
+                print(f"✓ Generated: {output_path}")
             self.stats['pages_generated'] += 1
 
         except Exception as e:
@@ -360,6 +757,121 @@ class SiteGenerator:
             traceback.print_exc()
             self.stats['errors'] += 1
 
+    def generate_pages_parallel(self, template_name, pages):
+        """
+        Render and write pages across a pool of worker processes
+        (output directories must already exist)
+
+        Args:
+            template_name: Name of the Jinja2 template
+            pages: List of (data, output_path) tuples
+        """
+        # Only send pages whose template or data changed since the previous build
+        fingerprints = {}
+        pending = []
+        for data, output_path in pages:
+            fingerprint = self.page_fingerprint(template_name, data, output_path)
+            if fingerprint and self.page_is_unchanged(fingerprint, output_path):
+                self._page_hashes.update([fingerprint])
+                self.stats['pages_skipped'] += 1
+            else:
+                fingerprints[output_path] = fingerprint
+                pending.append((data, output_path))
+
+        batches = [pending[i:i + RENDER_BATCH_SIZE] for i in range(0, len(pending), RENDER_BATCH_SIZE)]
+        if not batches:
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_render_worker,
+            initargs=(self.templates_dir, self.jinja_cache_dir, template_name)
+        ) as executor:
+            for results in executor.map(_render_batch, batches):
+                for output_path, error in results:
+                    if error:
+                        print(f"✗ Error generating page {output_path}: {error}")
+                        self.stats['errors'] += 1
+                    else:
+                        if fingerprints[output_path]:
+                            self._page_hashes.update([fingerprints[output_path]])
+                        if self.verbose:
+                            print(f"✓ Generated: {output_path}")
+                        self.stats['pages_generated'] += 1
+
+    def page_fingerprint(self, template_name, data, output_path):
+        """
+        Identify the inputs of a page for incremental builds
+
+        Args:
+            template_name: Name of the Jinja2 template
+            data: Dictionary of data passed to the template
+            output_path: Full path of the generated page
+
+        Returns:
+            (page key, input hash) tuple, or None if incremental builds are off
+        """
+        if not self.incremental:
+            return None
+
+        if self._templates_hash is None:
+            self._templates_hash = _hash_templates(self.templates_dir)
+
+        # Any template change invalidates every page, since templates can
+        # share blocks and macros
+        digest = hashlib.blake2b(self._templates_hash, digest_size=16)
+        digest.update(template_name.encode('utf-8'))
+        digest.update(json.dumps(data, sort_keys=True, default=str).encode('utf-8'))
+
+        return os.path.relpath(output_path, self.output_dir), digest.hexdigest()
+
+    def page_is_unchanged(self, fingerprint, output_path):
+        """
+        Check whether the previous build wrote output_path from the same inputs
+
+        Args:
+            fingerprint: Tuple returned by page_fingerprint()
+            output_path: Full path of the generated page
+        """
+        if self._previous_page_hashes is None:
+            self._previous_page_hashes = self._load_page_hashes()
+
+        page_key, page_hash = fingerprint
+        return self._previous_page_hashes.get(page_key) == page_hash and os.path.exists(output_path)
+
+    def _load_page_hashes(self):
+        """
+        Read the page input hashes saved by the previous build
+
+        The file is removed once read, so a build that fails before
+        save_page_hashes() makes the next build regenerate every page.
+        """
+        hashes_path = os.path.join(self.output_dir, PAGE_HASHES_FILE)
+        try:
+            with open(hashes_path, encoding='utf-8') as f:
+                hashes = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        os.remove(hashes_path)
+        return hashes
+
+    def save_page_hashes(self):
+        """Save the input hashes of this build's pages for the next build"""
+        hashes_path = os.path.join(self.output_dir, PAGE_HASHES_FILE)
+
+        # A full build records no hashes, and its pages may no longer match
+        # the ones saved before it
+        if not self.incremental:
+            if os.path.exists(hashes_path):
+                os.remove(hashes_path)
+            return
+
+        tmp_path = hashes_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_bytes(self._page_hashes))
+        # Replace atomically so an interrupted build never leaves a partial file
+        os.replace(tmp_path, hashes_path)
+
     def split_numbered_steps(self, text):
         """
         Split a text with numbered steps (e.g., "1. Do this. 2. Do that.")
@@ -374,9 +886,14 @@ class SiteGenerator:
         if not text:
             return []
 
+        # Without a digit there are no numbered steps to split or strip
+        if not _HAS_DIGIT.search(text):
+            text = text.strip()
+            return [text] if text else []
+
         # Split by pattern: space + digit + period + space (e.g., " 2. ")
         # This preserves periods within sentences
-        steps = re.split(r'\s+\d+\.\s+', text)
+        steps = _NUM_STEP_SPLIT.split(text)
 
         # Clean up steps and remove number prefix from first step if present
         cleaned_steps = []
@@ -384,11 +901,41 @@ class SiteGenerator:
             step = step.strip()
             if step:
                 # Remove leading number from first step (e.g., "1. text" -> "text")
-                step = re.sub(r'^\d+\.\s*', '', step)
+                step = _LEAD_NUM.sub('', step)
                 cleaned_steps.append(step)
 
         return cleaned_steps
 
+    def _load_feedback(self):
+        """
+        Load approved feedback from user_feedback.csv once for all permit pages
+
+        The file is only filtered, sorted and handed to templates, so it is
+        read with csv.DictReader rather than pandas.
+
+        Returns:
+            Dict mapping permit_slug to its approved feedback dictionaries,
+            sorted by helpful_count descending
+        """
+        if 'user_feedback.csv' not in self._cache:
+            feedback_by_permit = {}
+            feedback_file = os.path.join(self.data_dir, 'user_feedback.csv')
+            if os.path.exists(feedback_file):
+                with open(feedback_file, newline='', encoding='utf-8') as f:
+                    for item in csv.DictReader(f):
+                        if item['approved'] != 'yes':
+                            continue
+                        for col in ('helpful_count', 'github_issue_number'):
+                            if col in item:
+                                item[col] = int(item[col]) if item[col] else 0
+                        feedback_by_permit.setdefault(item['permit_slug'], []).append(item)
+
+                for items in feedback_by_permit.values():
+                    items.sort(key=lambda item: item['helpful_count'], reverse=True)
+
+            self._cache['user_feedback.csv'] = feedback_by_permit
+        return self._cache['user_feedback.csv']
+
     def load_feedback_for_permit(self, permit_slug):
         """
         Load approved feedback for a specific permit
@@ -400,53 +947,128 @@ class SiteGenerator:
             List of feedback dictionaries
         """
         try:
-            feedback_file = os.path.join(self.data_dir, 'user_feedback.csv')
-            if not os.path.exists(feedback_file):
-                return []
-
-            feedback_df = pd.read_csv(feedback_file)
-
-            # Filter for this permit and approved items
-            permit_feedback = feedback_df[
-                (feedback_df['permit_slug'] == permit_slug) &
-                (feedback_df['approved'] == 'yes')
-            ]
-
-            # Sort by helpful_count descending
-            permit_feedback = permit_feedback.sort_values('helpful_count', ascending=False)
-
-            return permit_feedback.to_dict('records')
+            return list(self._load_feedback().get(permit_slug, []))
         except FileNotFoundError:
             return []
         except Exception as e:
             print(f"⚠️  Warning: Could not load feedback for {permit_slug}: {str(e)}")
             return []
 
-    def generate_transaction_pages(self, df):
+    def _build_view_models(self, df):
         """
-        Generate all transaction pages from CSV data
+        Build the data for every generated page in a single pass over the rows
 
         Args:
             df: DataFrame with permit data
+
+        Returns:
+            SimpleNamespace with:
+                jurisdictions: {jurisdiction_slug: {'name', 'permits'}} for hub pages
+                homepage_stats: Permit and agency totals for the homepage
+                homepage_jurisdictions: Agencies with permit counts, sorted by name
+                recent_permits: Permit summaries for the homepage
+                sitemap_rows: (jurisdiction_slug, permit_slug, date_extracted) tuples
+                permits_json: Permit records for data.json
+                transaction_pages: (data, output_path) tuples for transaction pages
         """
-        print("\n📄 Generating transaction pages...\n")
+        df = self.add_slug_columns(df)
+
+        jurisdictions = {}
+        agencies = set()
+        agency_counts = {}
+        online_permits = 0
+        api_permits = 0
+        recent_permits = []
+        sitemap_rows = []
+        permits_json = []
+        transaction_pages = []
+
+        # Join each jurisdiction directory once; rows only append their slug
+        jurisdiction_dirs = {
+            slug: os.path.join(self.output_dir, slug)
+            for slug in df['jurisdiction_slug'].unique().tolist()
+        }
+
+        # Parse each distinct value of the JSON columns once; rows then look
+        # their parsed value up (empty and missing cells become [])
+        json_fields = ['community_feedback', 'user_tips', 'faqs']
+        parsed_json = {
+            field: {
+                value: _parse_json_field(value, field)
+                for value in df[field].unique().tolist()
+                if isinstance(value, str) and value
+            } if field in df.columns else {}
+            for field in json_fields
+        }
 
-        # Generate a page for each row in the CSV
-        for idx, row in df.iterrows():
-            # Convert row to dictionary
-            data = row.to_dict()
+        # (to_dict('records') yields plain dicts without building a Series per row)
+        for row in df.to_dict(orient='records'):
+            # Slugs are precomputed by add_slug_columns()
+            jurisdiction_slug = row['jurisdiction_slug']
+            permit_slug = row['permit_slug']
+            url_slug = f"/{jurisdiction_slug}/{permit_slug}/"
 
-            # Parse JSON fields
-            json_fields = ['community_feedback', 'user_tips', 'faqs']
+            # Jurisdiction hub listing
+            if jurisdiction_slug not in jurisdictions:
+                jurisdictions[jurisdiction_slug] = {
+                    'name': row['agency_short'],
+                    'permits': []
+                }
+
+            jurisdictions[jurisdiction_slug]['permits'].append({
+                'request_type': row['request_type'],
+                'agency_full': row['agency_full'],
+                'description': row['description'] if 'description' in row else '',
+                'cost': row['cost'],
+                'processing_time': row['processing_time'] if 'processing_time' in row else row.get('effort_hours', ''),
+                'online_available': row['online_available'],
+                'api_available': row['api_available'],
+                'mcp_available': row.get('mcp_available', 'No'),
+                'permit_slug': permit_slug,
+                'estimated_monthly_volume': row.get('estimated_monthly_volume', '0'),
+                '_volume_num': row['_volume_num']
+            })
+
+            # Homepage statistics (missing agency names are not counted)
+            if pd.notna(row['agency_full']):
+                agencies.add(row['agency_full'])
+            if pd.notna(row['agency_short']):
+                agency_counts[row['agency_short']] = agency_counts.get(row['agency_short'], 0) + 1
+            online_permits += row['online_available'] == 'Yes'
+            api_permits += row['api_available'] == 'Yes'
+
+            # Homepage listing
+            recent_permits.append({
+                'agency_short': row['agency_short'],
+                'request_type': row['request_type'],
+                'cost': row['cost'],
+                'effort_hours': row['effort_hours'],
+                'online_available': row['online_available'],
+                'url_slug': url_slug,
+                'jurisdiction_slug': jurisdiction_slug,
+                'permit_slug': permit_slug,
+                'location_applicability': row['location_applicability']
+            })
+
+            sitemap_rows.append((jurisdiction_slug, permit_slug, row['date_extracted']))
+
+            # data.json record: slug columns follow url_slug, source_url and
+            # _volume_num are internal only
+            permit = {
+                key: value for key, value in row.items()
+                if key not in ('jurisdiction_slug', 'permit_slug', '_volume_num', 'source_url')
+            }
+            permit['url_slug'] = url_slug
+            permit['jurisdiction_slug'] = jurisdiction_slug
+            permit['permit_slug'] = permit_slug
+            permits_json.append(permit)
+
+            # Transaction page (the row dict itself becomes the template data)
+            data = row
+
+            # Parsed JSON fields
             for field in json_fields:
-                if field in data and isinstance(data[field], str) and data[field]:
-                    try:
-                        data[field] = json.loads(data[field])
-                    except json.JSONDecodeError:
-                        print(f"⚠️  Warning: Could not parse JSON for {field}")
-                        data[field] = []
-                else:
-                    data[field] = []
+                data[field] = parsed_json[field].get(data.get(field), [])
 
             # Parse how_to_description into clean steps
             if 'how_to_description' in data and data['how_to_description']:
@@ -454,98 +1076,116 @@ class SiteGenerator:
             else:
                 data['how_to_steps'] = []
 
-            # Extract jurisdiction slug
-            state_abbrev = data['agency_short'].split()[0] if data['agency_short'] else ""
-            state_map = {
-                'CA': 'california',
-                'NY': 'new-york',
-                'TX': 'texas',
-                'FL': 'florida',
-            }
-            jurisdiction_slug = state_map.get(state_abbrev, self.slugify(state_abbrev))
-            data['jurisdiction_slug'] = jurisdiction_slug
-
-            # Generate clean permit slug (just the permit name, not state-permit)
-            permit_slug = self.slugify(data['request_type'])
-            data['permit_slug'] = permit_slug
-
             # Full URL slug for compatibility (jurisdiction-permit)
             data['url_slug'] = f"{jurisdiction_slug}-{permit_slug}"
 
+            # Load community feedback for this permit
+            data['feedback_items'] = self.load_feedback_for_permit(permit_slug)
+
             # Build output path: /output/{jurisdiction}/{permit-slug}/index.html
             # This creates clean URLs like /california/food-truck-permit/
-            output_path = os.path.join(
-                self.output_dir,
-                jurisdiction_slug,
-                permit_slug,
-                'index.html'
-            )
+            output_path = f"{jurisdiction_dirs[jurisdiction_slug]}{os.sep}{permit_slug}{os.sep}index.html"
+            transaction_pages.append((data, output_path))
 
-            # Load community feedback for this permit
-            data['feedback_items'] = self.load_feedback_for_permit(permit_slug)
+        homepage_stats = {
+            'total_permits': len(df),
+            'total_agencies': len(agencies),
+            'online_permits': online_permits,
+            'api_permits': api_permits
+        }
+
+        # Agencies sorted alphabetically, with permit counts
+        agency_names = sorted(agency_counts)
+        agency_slugs = self.slugify_series(pd.Series(agency_names, dtype=object)).tolist()
+        homepage_jurisdictions = [
+            {'name': name, 'slug': slug, 'permit_count': agency_counts[name]}
+            for name, slug in zip(agency_names, agency_slugs)
+        ]
+
+        return SimpleNamespace(
+            jurisdictions=jurisdictions,
+            homepage_stats=homepage_stats,
+            homepage_jurisdictions=homepage_jurisdictions,
+            recent_permits=recent_permits,
+            sitemap_rows=sitemap_rows,
+            permits_json=permits_json,
+            transaction_pages=transaction_pages
+        )
+
+    def generate_transaction_pages(self, df, sitemap=None, views=None):
+        """
+        Generate all transaction pages from CSV data
+
+        Args:
+            df: DataFrame with permit data
+            sitemap: Optional sitemap.xml file opened by begin_sitemap();
+                     each page's <url> entry is written in the same pass
+            views: View models from _build_view_models() (built from df if omitted)
+        """
+        print("\n📄 Generating transaction pages...")
+        pages_before = self.stats['pages_generated']
+        skipped_before = self.stats['pages_skipped']
+        views = views or self._build_view_models(df)
+        pages = views.transaction_pages
+
+        # Create each page directory once up front, so rendering only writes files
+        for directory in {os.path.dirname(output_path) for _, output_path in pages}:
+            self.ensure_directory(directory)
+
+        if self.workers > 1 and len(pages) >= PARALLEL_MIN_PAGES:
+            if sitemap is not None:
+                for row in views.sitemap_rows:
+                    self.add_sitemap_page(sitemap, *row)
+
+            self.generate_pages_parallel('transaction_page.html', pages)
+        else:
+            template = self.get_template('transaction_page.html')
+            for (data, output_path), row in zip(pages, views.sitemap_rows):
+                if sitemap is not None:
+                    self.add_sitemap_page(sitemap, *row)
+                self.generate_page(template, data, output_path)
 
-            # Generate the page
-            self.generate_page('transaction_page.html', data, output_path)
+        skipped = self.stats['pages_skipped'] - skipped_before
+        print(f"✓ Generated {self.stats['pages_generated'] - pages_before} transaction pages"
+              + (f" ({skipped} unchanged, skipped)" if skipped else ""))
 
-    def generate_jurisdiction_hubs(self, df):
+    def generate_jurisdiction_hubs(self, df, views=None):
         """
         Generate hub pages for each jurisdiction
 
         Args:
             df: DataFrame with permit data
+            views: View models from _build_view_models() (built from df if omitted)
         """
-        print("\n🌎 Generating jurisdiction hub pages...\n")
+        print("\n🌎 Generating jurisdiction hub pages...")
 
-        # Group permits by jurisdiction
-        jurisdictions = {}
-        for _, row in df.iterrows():
-            state_abbrev = row['agency_short'].split()[0] if row['agency_short'] else ""
-            state_map = {
-                'CA': 'california',
-                'NY': 'new-york',
-                'TX': 'texas',
-                'FL': 'florida',
-            }
-            jurisdiction_slug = state_map.get(state_abbrev, self.slugify(state_abbrev))
+        df = self.add_slug_columns(df)
 
-            if jurisdiction_slug not in jurisdictions:
-                jurisdictions[jurisdiction_slug] = {
-                    'name': row['agency_short'],
-                    'permits': []
-                }
+        # Permits grouped by jurisdiction
+        jurisdictions = (views or self._build_view_models(df)).jurisdictions
 
-            permit_slug = self.slugify(row['request_type'])
-            jurisdictions[jurisdiction_slug]['permits'].append({
-                'request_type': row['request_type'],
-                'agency_full': row['agency_full'],
-                'description': row['description'] if 'description' in row else '',
-                'cost': row['cost'],
-                'processing_time': row['processing_time'] if 'processing_time' in row else row.get('effort_hours', ''),
-                'online_available': row['online_available'],
-                'api_available': row['api_available'],
-                'mcp_available': row.get('mcp_available', 'No'),
-                'permit_slug': permit_slug,
-                'estimated_monthly_volume': row.get('estimated_monthly_volume', '0')
-            })
+        # Per-jurisdiction statistics, aggregated in pandas
+        availability = pd.DataFrame({
+            col: (df[col] == 'Yes') if col in df.columns else False
+            for col in ('online_available', 'api_available', 'mcp_available')
+        }, index=df.index)
+        availability['total'] = 1
+        hub_stats = availability.groupby(df['jurisdiction_slug'], sort=False).sum().to_dict(orient='index')
+
+        template = self.get_template('jurisdiction_hub.html')
 
         # Generate a hub page for each jurisdiction
         for jurisdiction_slug, data in jurisdictions.items():
             # Calculate statistics
-            total_permits = len(data['permits'])
-            online_permits = len([p for p in data['permits'] if p['online_available'] == 'Yes'])
-            api_permits = len([p for p in data['permits'] if p['api_available'] == 'Yes'])
-            mcp_permits = len([p for p in data['permits'] if p['mcp_available'] == 'Yes'])
-
-            # Sort permits by monthly volume (most popular first)
-            # Handle non-numeric values like '800-1200' by taking the first number
-            def get_volume(permit):
-                vol = permit.get('estimated_monthly_volume', '0')
-                # Extract first number from string like '800-1200' -> 800
-                import re
-                match = re.search(r'\d+', str(vol))
-                return int(match.group()) if match else 0
-
-            sorted_permits = sorted(data['permits'], key=get_volume, reverse=True)
+            counts = hub_stats[jurisdiction_slug]
+            total_permits = counts['total']
+            online_permits = counts['online_available']
+            api_permits = counts['api_available']
+            mcp_permits = counts['mcp_available']
+
+            # Sort permits by monthly volume (most popular first), using the
+            # first number precomputed by add_slug_columns()
+            sorted_permits = sorted(data['permits'], key=itemgetter('_volume_num'), reverse=True)
 
             # Get top 6 popular permits
             popular_permits = sorted_permits[:6]
@@ -569,202 +1209,145 @@ class SiteGenerator:
                 'index.html'
             )
 
-            self.generate_page('jurisdiction_hub.html', template_data, output_path)
+            self.generate_page(template, template_data, output_path)
 
-    def generate_homepage(self, df):
+    def generate_homepage(self, df, views=None):
         """
         Generate the homepage (index.html) with agency and permit listings
 
         Args:
             df: DataFrame with permit data
+            views: View models from _build_view_models() (built from df if omitted)
         """
         print("\n🏠 Generating homepage...")
 
-        # Calculate statistics
-        stats = {
-            'total_permits': len(df),
-            'total_agencies': df['agency_full'].nunique(),
-            'online_permits': len(df[df['online_available'] == 'Yes']),
-            'api_permits': len(df[df['api_available'] == 'Yes'])
-        }
-
-        # Get list of agencies with permit counts
-        agency_counts = df.groupby('agency_short').size().reset_index(name='permit_count')
-        jurisdictions = []
-        for _, row in agency_counts.iterrows():
-            # Generate slug for agency
-            agency_slug = self.slugify(row['agency_short'])
-            jurisdictions.append({
-                'name': row['agency_short'],
-                'slug': agency_slug,
-                'permit_count': row['permit_count']
-            })
-
-        # Sort agencies alphabetically
-        jurisdictions = sorted(jurisdictions, key=lambda x: x['name'])
-
-        # Get recent/featured permits (all permits for now)
-        recent_permits = []
-        for _, row in df.iterrows():
-            state_abbrev = row['agency_short'].split()[0] if row['agency_short'] else ""
-            state_map = {
-                'CA': 'california',
-                'NY': 'new-york',
-                'TX': 'texas',
-                'FL': 'florida',
-            }
-            jurisdiction_slug = state_map.get(state_abbrev, self.slugify(state_abbrev))
-            permit_slug = self.slugify(row['request_type'])
-
-            recent_permits.append({
-                'agency_short': row['agency_short'],
-                'request_type': row['request_type'],
-                'cost': row['cost'],
-                'effort_hours': row['effort_hours'],
-                'online_available': row['online_available'],
-                'url_slug': f"/{jurisdiction_slug}/{permit_slug}/",
-                'jurisdiction_slug': jurisdiction_slug,
-                'permit_slug': permit_slug,
-                'location_applicability': row['location_applicability']
-            })
+        # Statistics, agency counts and permit listings from the single row pass
+        views = views or self._build_view_models(df)
 
         # Prepare template data
         template_data = {
-            'stats': stats,
-            'jurisdictions': jurisdictions,
-            'recent_permits': recent_permits
+            'stats': views.homepage_stats,
+            'jurisdictions': views.homepage_jurisdictions,
+            'recent_permits': views.recent_permits
         }
 
         # Generate homepage
         output_path = os.path.join(self.output_dir, 'index.html')
-        self.generate_page('index.html', template_data, output_path)
+        self.generate_page(self.get_template('index.html'), template_data, output_path)
 
-    def generate_sitemap(self, df):
+    def begin_sitemap(self, df):
         """
-        Generate sitemap.xml with all page URLs and lastmod dates
+        Open sitemap.xml and write the homepage and jurisdiction hub entries
+
+        Transaction page entries are then added with add_sitemap_page() and
+        the file is completed with end_sitemap().
 
         Args:
             df: DataFrame with permit data
+
+        Returns:
+            Open sitemap file
         """
         print("\n🗺️  Generating sitemap.xml...")
 
-        # Base URL for the site
-        base_url = "https://permitindex.com"
+        today = datetime.now().strftime("%Y-%m-%d")
+        df = self.add_slug_columns(df)
 
-        # Build sitemap XML
-        sitemap_content = ['<?xml version="1.0" encoding="UTF-8"?>']
-        sitemap_content.append('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
+        # Stream the sitemap straight to disk, one <url> block at a time
+        sitemap_path = os.path.join(self.output_dir, 'sitemap.xml')
+        f = open(sitemap_path, 'wb', buffering=OUTPUT_WRITE_BUFFER)
 
         # Add homepage
-        sitemap_content.append('  <url>')
-        sitemap_content.append(f'    <loc>{base_url}/</loc>')
-        sitemap_content.append(f'    <lastmod>{datetime.now().strftime("%Y-%m-%d")}</lastmod>')
-        sitemap_content.append('    <changefreq>daily</changefreq>')
-        sitemap_content.append('    <priority>1.0</priority>')
-        sitemap_content.append('  </url>')
-
-        # Add jurisdiction hub pages
-        jurisdictions = df.groupby('agency_short').first().reset_index()
-        jurisdiction_slugs_added = set()
-
-        for _, row in jurisdictions.iterrows():
-            state_abbrev = row['agency_short'].split()[0] if row['agency_short'] else ""
-            state_map = {
-                'CA': 'california',
-                'NY': 'new-york',
-                'TX': 'texas',
-                'FL': 'florida',
-            }
-            jurisdiction_slug = state_map.get(state_abbrev, self.slugify(state_abbrev))
-
-            if jurisdiction_slug not in jurisdiction_slugs_added:
-                jurisdiction_slugs_added.add(jurisdiction_slug)
-                url = f"{base_url}/{jurisdiction_slug}/"
-
-                sitemap_content.append('  <url>')
-                sitemap_content.append(f'    <loc>{url}</loc>')
-                sitemap_content.append(f'    <lastmod>{datetime.now().strftime("%Y-%m-%d")}</lastmod>')
-                sitemap_content.append('    <changefreq>weekly</changefreq>')
-                sitemap_content.append('    <priority>0.9</priority>')
-                sitemap_content.append('  </url>')
-
-        # Add transaction pages with hierarchical URLs
-        for idx, row in df.iterrows():
-            state_abbrev = row['agency_short'].split()[0] if row['agency_short'] else ""
-            state_map = {
-                'CA': 'california',
-                'NY': 'new-york',
-                'TX': 'texas',
-                'FL': 'florida',
-            }
-            jurisdiction_slug = state_map.get(state_abbrev, self.slugify(state_abbrev))
-            permit_slug = self.slugify(row['request_type'])
+        parts = [SITEMAP_HEADER, SITEMAP_URL_TEMPLATE.format(
+            loc=f"{SITE_URL}/", lastmod=today, changefreq='daily', priority='1.0')]
+
+        # Add jurisdiction hub pages (in agency_short order, each slug once)
+        hub_slugs = df.sort_values('agency_short')['jurisdiction_slug'].drop_duplicates()
+        parts.extend(
+            SITEMAP_URL_TEMPLATE.format(
+                loc=f"{SITE_URL}/{jurisdiction_slug}/", lastmod=today,
+                changefreq='weekly', priority='0.9')
+            for jurisdiction_slug in hub_slugs.tolist()
+        )
+
+        f.write('\n'.join(parts).encode('utf-8'))
+        return f
+
+    def add_sitemap_page(self, sitemap, jurisdiction_slug, permit_slug, lastmod):
+        """
+        Write a transaction page entry to an open sitemap
 
-            # Use hierarchical URL: /jurisdiction/permit-slug/
-            url = f"{base_url}/{jurisdiction_slug}/{permit_slug}/"
+        Args:
+            sitemap: File returned by begin_sitemap()
+            jurisdiction_slug: Jurisdiction slug (e.g., 'california')
+            permit_slug: Permit slug (e.g., 'food-truck-operating-permit')
+            lastmod: Date the permit data was extracted
+        """
+        # Use hierarchical URL: /jurisdiction/permit-slug/
+        sitemap.write(('\n' + SITEMAP_URL_TEMPLATE.format(
+            loc=f"{SITE_URL}/{jurisdiction_slug}/{permit_slug}/", lastmod=lastmod,
+            changefreq='weekly', priority='0.8')).encode('utf-8'))
 
-            sitemap_content.append('  <url>')
-            sitemap_content.append(f'    <loc>{url}</loc>')
-            sitemap_content.append(f'    <lastmod>{row["date_extracted"]}</lastmod>')
-            sitemap_content.append('    <changefreq>weekly</changefreq>')
-            sitemap_content.append('    <priority>0.8</priority>')
-            sitemap_content.append('  </url>')
+    def end_sitemap(self, sitemap):
+        """
+        Close the urlset and the sitemap file
 
-        sitemap_content.append('</urlset>')
+        Args:
+            sitemap: File returned by begin_sitemap()
+        """
+        sitemap.write(('\n' + SITEMAP_FOOTER).encode('utf-8'))
+        sitemap.close()
+        print(f"✓ Sitemap generated: {sitemap.name}")
 
-        # Write sitemap
-        sitemap_path = os.path.join(self.output_dir, 'sitemap.xml')
-        with open(sitemap_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(sitemap_content))
+    def generate_sitemap(self, df, views=None):
+        """
+        Generate sitemap.xml with all page URLs and lastmod dates
 
-        print(f"✓ Sitemap generated: {sitemap_path}")
+        Args:
+            df: DataFrame with permit data
+            views: View models from _build_view_models() (built from df if omitted)
+        """
+        df = self.add_slug_columns(df)
+        sitemap_rows = (views or self._build_view_models(df)).sitemap_rows
 
-    def generate_data_json(self, df):
+        sitemap = self.begin_sitemap(df)
+        try:
+            # Add transaction pages with hierarchical URLs, joined into one write
+            sitemap.write(''.join(
+                '\n' + SITEMAP_URL_TEMPLATE.format(
+                    loc=f"{SITE_URL}/{jurisdiction_slug}/{permit_slug}/", lastmod=date_extracted,
+                    changefreq='weekly', priority='0.8')
+                for jurisdiction_slug, permit_slug, date_extracted in sitemap_rows
+            ).encode('utf-8'))
+        finally:
+            self.end_sitemap(sitemap)
+
+    def generate_data_json(self, df, views=None):
         """
         Generate data.json for future search/filter features
 
         Args:
             df: DataFrame with permit data
+            views: View models from _build_view_models() (built from df if omitted)
         """
         print("\n📊 Generating data.json...")
 
-        # Convert DataFrame to list of dicts with URL slugs
-        permits_data = []
-        for _, row in df.iterrows():
-            permit = row.to_dict()
-
-            # Generate hierarchical URL
-            state_abbrev = row['agency_short'].split()[0] if row['agency_short'] else ""
-            state_map = {
-                'CA': 'california',
-                'NY': 'new-york',
-                'TX': 'texas',
-                'FL': 'florida',
-            }
-            jurisdiction_slug = state_map.get(state_abbrev, self.slugify(state_abbrev))
-            permit_slug = self.slugify(row['request_type'])
-
-            # Add generated URL slug (hierarchical format)
-            permit['url_slug'] = f"/{jurisdiction_slug}/{permit_slug}/"
-            permit['jurisdiction_slug'] = jurisdiction_slug
-            permit['permit_slug'] = permit_slug
-
-            # Remove source_url (internal only)
-            if 'source_url' in permit:
-                del permit['source_url']
-            permits_data.append(permit)
-
-        # Create data structure
-        data = {
-            'generated_at': datetime.now().isoformat(),
-            'total_permits': len(permits_data),
-            'permits': permits_data
-        }
+        # Permit records with URL slugs
+        permits_data = (views or self._build_view_models(df)).permits_json
 
-        # Write JSON file
+        # Write JSON file one permit record per line, so only a single
+        # record is ever serialized in memory at a time
         json_path = os.path.join(self.output_dir, 'data.json')
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(json_path, 'wb', buffering=OUTPUT_WRITE_BUFFER) as f:
+            f.write(b'{"generated_at":' + _json_bytes(datetime.now().isoformat()) +
+                    b',"total_permits":' + _json_bytes(len(permits_data)) +
+                    b',"permits":[')
+            separator = b'\n'
+            for permit in permits_data:
+                f.write(separator)
+                f.write(_json_bytes(permit))
+                separator = b',\n'
+            f.write(b'\n]}\n')
 
         print(f"✓ Data JSON generated: {json_path}")
 
@@ -773,12 +1356,13 @@ class SiteGenerator:
         print("\n📋 Generating build manifest...")
 
         # Count permits per source file
-        permits_by_file = df.groupby('source_file').size().to_dict() if 'source_file' in df.columns else {}
+        permits_by_file = df.groupby('source_file', observed=True).size().to_dict() if 'source_file' in df.columns else {}
 
         manifest = {
             'build_time': datetime.now().isoformat(),
             'generator_version': '2.0',
-            'total_pages': self.stats['pages_generated'],
+            'total_pages': self.stats['pages_generated'] + self.stats['pages_skipped'],
+            'pages_skipped': self.stats['pages_skipped'],
             'total_permits': len(df),
             'files_processed': self.stats['files_loaded'],
             'permits_per_file': permits_by_file,
@@ -788,8 +1372,8 @@ class SiteGenerator:
         }
 
         manifest_path = os.path.join(self.output_dir, 'build_manifest.json')
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        with open(manifest_path, 'wb') as f:
+            f.write(json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8'))
 
         print(f"✓ Build manifest created: {manifest_path}")
 
@@ -810,8 +1394,8 @@ class SiteGenerator:
 
         # Write robots.txt
         robots_path = os.path.join(self.output_dir, 'robots.txt')
-        with open(robots_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(robots_content))
+        with open(robots_path, 'wb') as f:
+            f.write('\n'.join(robots_content).encode('utf-8'))
 
         print(f"✓ Robots.txt generated: {robots_path}")
 
@@ -833,10 +1417,12 @@ class SiteGenerator:
 
         # Copy all files from source to destination
         try:
-            for filename in os.listdir(source_dir):
-                source_file = os.path.join(source_dir, filename)
-                if os.path.isfile(source_file):
-                    shutil.copy2(source_file, os.path.join(dest_dir, filename))
+            # scandir entries carry their file type, so no extra stat per file;
+            # copy2 uses the kernel's zero-copy sendfile() fast path on Linux
+            with os.scandir(source_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        shutil.copy2(entry.path, os.path.join(dest_dir, entry.name))
             print(f"✓ Favicon files copied: {dest_dir}")
         except Exception as e:
             print(f"✗ Error copying favicon files: {e}")
@@ -851,6 +1437,8 @@ class SiteGenerator:
         print("📊 GENERATION STATISTICS")
         print("=" * 60)
         print(f"Pages generated: {self.stats['pages_generated']}")
+        if self.stats['pages_skipped']:
+            print(f"Pages unchanged (skipped): {self.stats['pages_skipped']}")
         print(f"CSV files loaded: {self.stats['files_loaded']}")
         print(f"Errors: {self.stats['errors']}")
         print(f"Duration: {duration:.2f} seconds")
@@ -871,20 +1459,34 @@ class SiteGenerator:
             print("❌ Build failed due to validation errors")
             return 1
 
+        # Compute URL slugs once for every generator
+        df = self.add_slug_columns(df)
+
+        # Compile every page template once before rendering anything
+        for template_name in PAGE_TEMPLATES:
+            self.get_template(template_name)
+
+        # Build every page's data in one pass over the rows
+        views = self._build_view_models(df)
+
         # Generate homepage
-        self.generate_homepage(df)
+        self.generate_homepage(df, views)
 
         # Generate jurisdiction hub pages
-        self.generate_jurisdiction_hubs(df)
+        self.generate_jurisdiction_hubs(df, views)
 
-        # Generate transaction pages
-        self.generate_transaction_pages(df)
+        # Generate transaction pages and sitemap.xml together
+        sitemap = self.begin_sitemap(df)
+        try:
+            self.generate_transaction_pages(df, sitemap=sitemap, views=views)
+        finally:
+            self.end_sitemap(sitemap)
 
-        # Generate sitemap
-        self.generate_sitemap(df)
+        # Remember page inputs so the next build can skip unchanged pages
+        self.save_page_hashes()
 
         # Generate data.json
-        self.generate_data_json(df)
+        self.generate_data_json(df, views)
 
         # Generate build manifest
         self.generate_build_manifest(df)
@@ -910,7 +1512,21 @@ class SiteGenerator:
 
 def main():
     """Main entry point"""
-    generator = SiteGenerator()
+    parser = argparse.ArgumentParser(description='PermitIndex static site generator')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-parse every CSV instead of using the Parquet cache')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Print a line for every generated page')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='Processes used to render transaction pages '
+                             '(default: CPU count; 1 disables the process pool, '
+                             f'which is only used for {PARALLEL_MIN_PAGES}+ pages)')
+    parser.add_argument('--full', action='store_true',
+                        help='Regenerate every page, even if its template and data are unchanged')
+    args = parser.parse_args()
+
+    generator = SiteGenerator(workers=args.workers, use_cache=not args.no_cache,
+                              verbose=args.verbose, incremental=not args.full)
     return generator.generate()
 
 
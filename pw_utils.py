@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Shared Playwright browser launch settings for the PermitIndex scripts
+"""
+
+# Chromium flags for every launch: use /tmp rather than the (often tiny)
+# /dev/shm of CI containers for shared memory, and load no extensions
+LAUNCH_ARGS = ['--disable-dev-shm-usage', '--disable-extensions']
+
+async def launch_browser(p, headless=True):
+    """Launch Chromium from a started async Playwright p with LAUNCH_ARGS"""
+    return await p.chromium.launch(headless=headless, args=LAUNCH_ARGS)
@@ -0,0 +1,43 @@
+"""
+Shared pytest fixtures for the Playwright browser tests
+
+The test modules also run as plain scripts (python3 tests/<file>.py); these
+fixtures only apply when they are collected by pytest.
+"""
+
+import os
+
+import pytest
+from playwright.sync_api import sync_playwright
+
+
+@pytest.fixture(scope="session")
+def site_url():
+    """Base URL of the site under test (PERMITINDEX_TEST_URL, default localhost:8000)"""
+    return os.environ.get("PERMITINDEX_TEST_URL", "http://localhost:8000")
+
+
+@pytest.fixture(scope="session")
+def playwright(request):
+    """
+    One Playwright driver (a node subprocess) shared by every test in the session
+
+    Tests that need their own browser launch options take this fixture;
+    everything else uses the shared browser below.
+    """
+    playwright = sync_playwright().start()
+    request.addfinalizer(playwright.stop)
+    return playwright
+
+
+@pytest.fixture(scope="session")
+def browser(playwright):
+    """
+    One headless Chromium instance shared by every test in the session
+
+    Under pytest-xdist each worker process has its own session, and so its
+    own browser.
+    """
+    browser = playwright.chromium.launch(headless=True)
+    yield browser
+    browser.close()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests that generator.read_csv returns the same values whichever parser it uses
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import generator
+
+# Missing-value spellings pandas' C engine reads as NaN, next to real values
+NA_CSV = """name,note,status,count
+N/A,NA,null,1
+Permit,NaN,,2
+#N/A,n/a,None,NA
+"""
+
+
+def as_values(df):
+    """Column -> list of values, with every NaN/None as None"""
+    return {
+        col: [None if v is None or (isinstance(v, float) and math.isnan(v)) else v for v in df[col]]
+        for col in df.columns
+    }
+
+
+# The real pd.read_csv, kept before any test patches it
+pandas_read_csv = pd.read_csv
+
+
+def read_with_c_engine(path, **kwargs):
+    """pd.read_csv with the pyarrow engine unavailable"""
+    if kwargs.get('engine') == 'pyarrow':
+        raise ImportError("pyarrow engine disabled for this test")
+    return pandas_read_csv(path, **kwargs)
+
+
+@pytest.fixture
+def na_csv(tmp_path):
+    path = tmp_path / "permits.csv"
+    path.write_text(NA_CSV)
+    return str(path)
+
+
+def test_na_values_match_pandas():
+    """CSV_NA_VALUES is pandas' own default NA list"""
+    from pandas._libs.parsers import STR_NA_VALUES
+    assert set(generator.CSV_NA_VALUES) == STR_NA_VALUES
+
+
+@pytest.mark.parametrize("parser", ["polars", "pyarrow", "c"])
+def test_read_csv_parsers_agree(na_csv, parser, monkeypatch):
+    """Every parser path turns pandas' NA tokens into NaN, like the C engine"""
+    expected = as_values(pandas_read_csv(na_csv))
+
+    if parser == "polars":
+        pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(generator, "pl", None)
+    if parser == "pyarrow":
+        pytest.importorskip("pyarrow")
+    if parser == "c":
+        monkeypatch.setattr(pd, "read_csv", read_with_c_engine)
+
+    assert as_values(generator.read_csv(na_csv)) == expected
+
+
+def test_read_csv_parquet_cache_agrees(na_csv):
+    """Values read back from the Parquet cache match the C engine too"""
+    pytest.importorskip("pyarrow")
+    expected = as_values(pandas_read_csv(na_csv))
+
+    generator.read_csv(na_csv, use_cache=True)
+    assert Path(na_csv + ".cache.parquet").exists()
+    assert as_values(generator.read_csv(na_csv, use_cache=True)) == expected
@@ -4,16 +4,145 @@ Visual Regression Tests for PermitIndex
 Tests for duplicate elements, timeline numbering, and visual alignment issues.
 """
 
+import hashlib
+import io
 import os
+import re
 import sys
 from pathlib import Path
+from urllib.parse import urlparse
+from PIL import Image
 from playwright.sync_api import sync_playwright
 import json
-from collections import Counter
+import numpy as np
 
 # Add parent directory to path to import generator
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Permit pages under test: (URL path, screenshot name)
+TEST_PAGES = [
+    ("california/food-truck-operating-permit/", "food-truck-permit"),
+    ("california/business-license/", "business-license"),
+    ("california/contractor-license/", "contractor-license"),
+]
+
+VIEWPORT = {"width": 1920, "height": 1080}
+
+# Numbered circles of the "How to Apply" timeline steps
+CIRCLE_SELECTOR = 'div[style*="background: var(--primary)"][style*="color: white"]'
+
+# Screenshots are cut into viewport-height strips and each strip gets a
+# HASH_SIZE x HASH_SIZE bit perceptual hash, so a change in one section isn't
+# diluted by the rest of the page. A bit is only set when a pixel is brighter
+# than its neighbour by more than HASH_MARGIN grey levels, which keeps flat
+# backgrounds from flipping bits on pixel noise. Measured on the baseline
+# screenshots, pixel noise of up to 3 grey levels and slight blur flip at most
+# 4 bits of a strip while blanking a 300px section flips 30+, hence
+# HASH_TOLERANCE_BITS per strip
+STRIP_HEIGHT = VIEWPORT["height"]
+HASH_SIZE = 32
+HASH_MARGIN = 6
+HASH_TOLERANCE_BITS = 4
+
+
+def screenshot_hashes(png_bytes):
+    """
+    Difference hashes (dHash) of a PNG screenshot, one hex string per
+    STRIP_HEIGHT strip from the top
+
+    Each strip is shrunk to (HASH_SIZE + 1) x HASH_SIZE grayscale pixels and
+    each bit records whether a pixel is brighter than its right-hand neighbour
+    (by more than HASH_MARGIN), so antialiasing and PNG recompression barely
+    change it but layout changes do.
+    """
+    image = Image.open(io.BytesIO(png_bytes)).convert("L")
+    hashes = []
+    for top in range(0, image.height, STRIP_HEIGHT):
+        strip = image.crop((0, top, image.width, min(top + STRIP_HEIGHT, image.height)))
+        pixels = strip.resize((HASH_SIZE + 1, HASH_SIZE), Image.LANCZOS).tobytes()
+
+        bits = 0
+        for row in range(HASH_SIZE):
+            offset = row * (HASH_SIZE + 1)
+            for col in range(HASH_SIZE):
+                bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1] + HASH_MARGIN)
+
+        hashes.append(f"{bits:0{HASH_SIZE * HASH_SIZE // 4}x}")
+    return hashes
+
+
+def hash_distance(hash_a, hash_b):
+    """Number of differing bits between two screenshot hashes"""
+    return bin(int(hash_a, 16) ^ int(hash_b, 16)).count("1")
+
+
+# Subresources that change how a page renders; their bodies are part of the
+# page fingerprint along with the DOM
+RENDER_RESOURCE_TYPES = {"stylesheet", "script", "font", "image"}
+
+
+def page_fingerprint(page, responses):
+    """
+    MD5 of the rendered DOM and of every render subresource among responses;
+    a cheap fingerprint checked before taking a screenshot
+
+    Covering the stylesheets, scripts (the Tailwind CDN build), fonts and
+    images means a CSS-only change still counts as a change.
+    """
+    digest = hashlib.md5(page.content().encode())
+    for response in sorted(responses, key=lambda response: response.url):
+        if response.ok and response.request.resource_type in RENDER_RESOURCE_TYPES:
+            digest.update(response.url.encode())
+            digest.update(hashlib.md5(response.body()).digest())
+    return digest.hexdigest()
+
+
+# Static assets are fetched once per test process and then served from memory
+STATIC_ASSET_RE = re.compile(r"\.(css|js|woff2?|png|svg|ico)(\?|$)")
+_asset_cache = {}
+
+
+def _serve_cached_asset(route):
+    """Fulfill a static asset request from memory, fetching it on first use"""
+    url = route.request.url
+    cached = _asset_cache.get(url)
+    if cached is None:
+        response = route.fetch()
+        if response.status != 200:
+            route.fulfill(response=response)
+            return
+        cached = _asset_cache[url] = (response.headers, response.body())
+    headers, body = cached
+    route.fulfill(status=200, headers=headers, body=body)
+
+
+# Third-party hosts the pages need to render (Tailwind provides the layout);
+# every other external request, e.g. analytics, is blocked
+ALLOWED_THIRD_PARTY_HOSTS = ("cdn.tailwindcss.com",)
+
+
+def new_test_context(browser, base_url):
+    """
+    Create a browser context for the site at base_url
+
+    Static assets are cached across pages and requests to hosts other than
+    the site and ALLOWED_THIRD_PARTY_HOSTS are aborted, which keeps
+    screenshots deterministic.
+    """
+    allowed_hosts = {urlparse(base_url).hostname, *ALLOWED_THIRD_PARTY_HOSTS}
+
+    def block_third_party(route):
+        if urlparse(route.request.url).hostname in allowed_hosts:
+            route.fallback()
+        else:
+            route.abort()
+
+    context = browser.new_context(viewport=VIEWPORT)
+    context.route(STATIC_ASSET_RE, _serve_cached_asset)
+    # Registered last so it runs first; allowed requests fall back to the cache route
+    context.route("**/*", block_third_party)
+    return context
+
 class VisualRegressionTester:
     def __init__(self, base_url="http://localhost:8000"):
         self.base_url = base_url
@@ -22,10 +151,14 @@ class VisualRegressionTester:
         self.current_dir = self.output_dir / "current"
         self.diff_dir = self.output_dir / "diff"
 
-        # Create directories
-        self.baseline_dir.mkdir(parents=True, exist_ok=True)
-        self.current_dir.mkdir(parents=True, exist_ok=True)
-        self.diff_dir.mkdir(parents=True, exist_ok=True)
+        # Directories are created on first write (see ensure_dirs)
+        self._dirs_ready = False
+
+        # Log lines are buffered and written out once per page (see flush_log)
+        self._log_buffer = []
+
+        # Responses received while the current page loaded (see load_page)
+        self.page_responses = []
 
         self.results = {
             "passed": 0,
@@ -33,6 +166,14 @@ class VisualRegressionTester:
             "errors": []
         }
 
+    def ensure_dirs(self):
+        """Create the screenshot directories once, before the first write"""
+        if not self._dirs_ready:
+            self.baseline_dir.mkdir(parents=True, exist_ok=True)
+            self.current_dir.mkdir(parents=True, exist_ok=True)
+            self.diff_dir.mkdir(parents=True, exist_ok=True)
+            self._dirs_ready = True
+
     def log(self, message, level="INFO"):
         """Log a message with color coding"""
         colors = {
@@ -42,36 +183,40 @@ class VisualRegressionTester:
             "WARN": "\033[93m"
         }
         reset = "\033[0m"
-        print(f"{colors.get(level, '')}{level}: {message}{reset}")
+        self._log_buffer.append(f"{colors.get(level, '')}{level}: {message}{reset}")
+
+    def flush_log(self):
+        """Write the buffered log lines to stdout in one call"""
+        if self._log_buffer:
+            sys.stdout.write("\n".join(self._log_buffer) + "\n")
+            sys.stdout.flush()
+            self._log_buffer.clear()
 
     def test_timeline_numbering(self, page, permit_url):
         """
         Test that timeline shows correct sequential numbering without duplicates
+        (page must already be loaded with load_page)
         """
         test_name = "Timeline Numbering"
         self.log(f"Running: {test_name}", "INFO")
 
         try:
-            page.goto(f"{self.base_url}/{permit_url}")
-            page.wait_for_load_state("networkidle")
-
-            # Find all numbered circles in the timeline
-            circles = page.locator('div[style*="background: var(--primary)"][style*="color: white"]').filter(has_text='')
-            circle_count = circles.count()
-
-            # Get the numbers from each circle
-            circle_numbers = []
-            for i in range(circle_count):
-                number_text = circles.nth(i).inner_text().strip()
-                if number_text.isdigit():
-                    circle_numbers.append(int(number_text))
-
-            # Check for sequential numbering (1, 2, 3, ...)
-            expected = list(range(1, len(circle_numbers) + 1))
-
-            if circle_numbers != expected:
+            # Check in the browser that the numbered circles in the timeline read
+            # 1, 2, 3, ...; the numbers are only sent back when they don't
+            numbering = page.evaluate(f"""() => {{
+                const numbers = Array.from(document.querySelectorAll('{CIRCLE_SELECTOR}'))
+                    .map(el => el.innerText.trim())
+                    .filter(text => /^\\d+$/.test(text))
+                    .map(Number);
+                const sequential = numbers.every((number, i) => number === i + 1);
+                return {{count: numbers.length, numbers: sequential ? null : numbers}};
+            }}""")
+            step_count = numbering["count"]
+
+            if numbering["numbers"] is not None:
+                expected = list(range(1, step_count + 1))
                 self.results["failed"] += 1
-                error = f"{test_name} FAILED: Expected {expected}, got {circle_numbers}"
+                error = f"{test_name} FAILED: Expected {expected}, got {numbering['numbers']}"
                 self.results["errors"].append(error)
                 self.log(error, "FAIL")
                 return False
@@ -88,7 +233,7 @@ class VisualRegressionTester:
                     return False
 
             self.results["passed"] += 1
-            self.log(f"{test_name} PASSED: {len(circle_numbers)} steps with correct sequential numbering", "PASS")
+            self.log(f"{test_name} PASSED: {step_count} steps with correct sequential numbering", "PASS")
             return True
 
         except Exception as e:
@@ -101,14 +246,12 @@ class VisualRegressionTester:
     def test_no_duplicate_elements(self, page, permit_url):
         """
         Test for duplicate text or elements in the timeline section
+        (page must already be loaded with load_page)
         """
         test_name = "No Duplicate Timeline Elements"
         self.log(f"Running: {test_name}", "INFO")
 
         try:
-            page.goto(f"{self.base_url}/{permit_url}")
-            page.wait_for_load_state("networkidle")
-
             # Focus on the timeline section only
             timeline_section = page.locator('section.star-box:has(h2:text("How to Apply"))')
 
@@ -116,10 +259,17 @@ class VisualRegressionTester:
                 self.log(f"{test_name} SKIPPED: No timeline section found", "WARN")
                 return True
 
-            # Check for duplicate step text within timeline
-            step_texts = timeline_section.locator('p.leading-relaxed').all_inner_texts()
-            text_counts = Counter([t.strip() for t in step_texts if t.strip()])
-            duplicates = {text[:50]: count for text, count in text_counts.items() if count > 1}
+            # Check for duplicate step text within timeline (counted in the browser,
+            # so only the duplicates come back over the wire)
+            repeated = timeline_section.evaluate_all("""sections => {
+                const counts = new Map();
+                sections.forEach(section => section.querySelectorAll('p.leading-relaxed').forEach(p => {
+                    const text = p.innerText.trim();
+                    if (text) counts.set(text, (counts.get(text) || 0) + 1);
+                }));
+                return [...counts].filter(([, count]) => count > 1);
+            }""")
+            duplicates = {text[:50]: count for text, count in repeated}
 
             if duplicates:
                 self.results["failed"] += 1
@@ -142,14 +292,12 @@ class VisualRegressionTester:
     def test_visual_alignment(self, page, permit_url):
         """
         Test that timeline circles and text are properly aligned
+        (page must already be loaded with load_page)
         """
         test_name = "Timeline Visual Alignment"
         self.log(f"Running: {test_name}", "INFO")
 
         try:
-            page.goto(f"{self.base_url}/{permit_url}")
-            page.wait_for_load_state("networkidle")
-
             # Focus on the timeline section only
             timeline_section = page.locator('section.star-box:has(h2:text("How to Apply"))')
 
@@ -157,39 +305,46 @@ class VisualRegressionTester:
                 self.log(f"{test_name} SKIPPED: No timeline section found", "WARN")
                 return True
 
-            # Get timeline step containers within the section
-            # Only select containers that have the numbered circles
-            step_containers = timeline_section.locator('div.flex.items-start:has(div[style*="background: var(--primary)"][style*="color: white"])')
-            step_count = step_containers.count()
+            # Get the circle and text boxes of every timeline step container in one
+            # evaluate call; only containers that have a numbered circle are steps.
+            # Elements without a layout box (hidden) report null, like bounding_box()
+            steps = timeline_section.evaluate_all(f"""sections => sections.flatMap(section =>
+                Array.from(section.querySelectorAll('div.flex.items-start'))
+                    .filter(container => container.querySelector('{CIRCLE_SELECTOR}'))
+                    .map(container => {{
+                        const box = el => {{
+                            if (!el) return null;
+                            const rect = el.getBoundingClientRect();
+                            return rect.width || rect.height ? {{x: rect.x, width: rect.width}} : null;
+                        }};
+                        const circle = container.querySelector('div[style*="background: var(--primary)"]');
+                        const text = container.querySelector('p.leading-relaxed');
+                        return {{hasText: !!text, circle: box(circle), text: box(text)}};
+                    }}))""")
+            step_count = len(steps)
+
+            # Horizontal overlap of each step's circle into its text, computed for
+            # all steps at once; steps missing either box get NaN and never match
+            boxes = np.array([
+                (step["circle"]["x"], step["circle"]["width"], step["text"]["x"])
+                if step["circle"] and step["text"] else (np.nan, np.nan, np.nan)
+                for step in steps
+            ], dtype=float).reshape(-1, 3)
+            circle_x, circle_width, text_x = boxes.T
+            overlaps = (circle_x + circle_width) - text_x
 
             alignment_issues = []
 
-            for i in range(step_count):
-                container = step_containers.nth(i)
-
-                # Check if container has both circle and text
-                circle = container.locator('div[style*="background: var(--primary)"]')
-                text = container.locator('p.leading-relaxed')
-
-                if circle.count() == 0:
-                    alignment_issues.append(f"Step {i+1}: Missing circle")
-                if text.count() == 0:
+            # Every step has a circle (see the filter above); check for its text
+            for i, step in enumerate(steps):
+                if not step["hasText"]:
                     alignment_issues.append(f"Step {i+1}: Missing text")
 
-                # Check bounding boxes for overlap/misalignment
-                if circle.count() > 0 and text.count() > 0:
-                    circle_box = circle.bounding_box()
-                    text_box = text.bounding_box()
-
-                    if circle_box and text_box:
-                        # Check if elements overlap (x coordinates)
-                        if circle_box['x'] + circle_box['width'] > text_box['x']:
-                            # Small overlap is OK (margin), but significant overlap is bad
-                            overlap = (circle_box['x'] + circle_box['width']) - text_box['x']
-                            if overlap > 10:  # More than 10px overlap
-                                alignment_issues.append(
-                                    f"Step {i+1}: Circle and text overlap by {overlap:.0f}px"
-                                )
+            # Small overlap is OK (margin), but more than 10px is bad
+            for i in np.flatnonzero(overlaps > 10):
+                alignment_issues.append(
+                    f"Step {i+1}: Circle and text overlap by {overlaps[i]:.0f}px"
+                )
 
             if alignment_issues:
                 self.results["failed"] += 1
@@ -209,48 +364,122 @@ class VisualRegressionTester:
             self.log(error, "FAIL")
             return False
 
+    def load_page(self, page, permit_url):
+        """
+        Navigate to a permit page once; every check then runs on the loaded DOM
+
+        Waits for the page's load event (stylesheets and images) and the first
+        content card instead of networkidle, which idles 500ms after the last
+        request (analytics, fonts) the checks don't depend on. The responses
+        received meanwhile are kept in page_responses for page_fingerprint.
+        """
+        self.page_responses = []
+        on_response = self.page_responses.append
+        page.on("response", on_response)
+        try:
+            page.goto(f"{self.base_url}/{permit_url}")
+            page.locator('section.star-box').first.wait_for(state="visible", timeout=10000)
+        finally:
+            page.remove_listener("response", on_response)
+
+    def check_permit_page(self, page, permit_url, name):
+        """
+        Load a permit page and run all functional and visual checks on it
+
+        The page's log lines are written out together at the end, so output
+        from parallel workers doesn't interleave.
+        """
+        try:
+            self.load_page(page, permit_url)
+        except Exception as e:
+            self.results["failed"] += 1
+            error = f"Loading {permit_url} ERROR: {str(e)}"
+            self.results["errors"].append(error)
+            self.log(error, "FAIL")
+            self.flush_log()
+            return
+
+        try:
+            self.test_timeline_numbering(page, permit_url)
+            self.test_no_duplicate_elements(page, permit_url)
+            self.test_visual_alignment(page, permit_url)
+            self.test_visual_regression(page, permit_url, name)
+        finally:
+            self.flush_log()
+
     def take_screenshot(self, page, name, baseline=False):
         """
-        Take a screenshot and save to appropriate directory
+        Take a full-page screenshot; baselines only store its perceptual hashes
+        and the page fingerprint (as <name>.fingerprint), which lets later runs
+        skip the screenshot of an unchanged page
         """
-        target_dir = self.baseline_dir if baseline else self.current_dir
-        filepath = target_dir / f"{name}.png"
-        page.screenshot(path=str(filepath), full_page=True)
+        png_bytes = page.screenshot(full_page=True)
+        self.ensure_dirs()
+        if baseline:
+            filepath = self.baseline_dir / f"{name}.dhash"
+            filepath.write_text("\n".join(screenshot_hashes(png_bytes)) + "\n")
+            (self.baseline_dir / f"{name}.fingerprint").write_text(
+                page_fingerprint(page, self.page_responses) + "\n")
+        else:
+            filepath = self.current_dir / f"{name}.png"
+            filepath.write_bytes(png_bytes)
         return filepath
 
     def test_visual_regression(self, page, permit_url, name):
         """
         Compare current screenshot with baseline
+        (page must already be loaded with load_page)
         """
         test_name = f"Visual Regression: {name}"
         self.log(f"Running: {test_name}", "INFO")
 
         try:
-            page.goto(f"{self.base_url}/{permit_url}")
-            page.wait_for_load_state("networkidle")
-
-            baseline_path = self.baseline_dir / f"{name}.png"
-            current_path = self.current_dir / f"{name}.png"
-
-            # Take current screenshot
-            page.screenshot(path=str(current_path), full_page=True)
-
-            # Check if baseline exists
-            if not baseline_path.exists():
+            baseline_path = self.baseline_dir / f"{name}.dhash"
+            fingerprint_path = self.baseline_dir / f"{name}.fingerprint"
+
+            # The same DOM and subresources render the same page, so skip the
+            # full-page screenshot; fingerprints are only written by --mode baseline
+            try:
+                if fingerprint_path.read_text().strip() == page_fingerprint(page, self.page_responses):
+                    self.results["passed"] += 1
+                    self.log(f"{test_name} PASSED: Page fingerprint matches baseline", "PASS")
+                    return True
+            except FileNotFoundError:
+                pass
+
+            # Take current screenshot in memory; it is only written to disk on failure
+            png_bytes = page.screenshot(full_page=True)
+            current_hashes = screenshot_hashes(png_bytes)
+
+            # Read the baseline hashes (a single open; no separate exists()/stat() call)
+            try:
+                baseline_hashes = baseline_path.read_text().split()
+            except FileNotFoundError:
                 self.log(f"{test_name} SKIPPED: No baseline found. Current screenshot saved as baseline.", "WARN")
-                page.screenshot(path=str(baseline_path), full_page=True)
+                self.ensure_dirs()
+                baseline_path.write_text("\n".join(current_hashes) + "\n")
                 return True
 
-            # Compare screenshots (basic file size comparison for now)
-            baseline_size = baseline_path.stat().st_size
-            current_size = current_path.stat().st_size
-
-            # Allow 5% difference
-            diff_percent = abs(baseline_size - current_size) / baseline_size * 100
+            # Compare perceptual hashes strip by strip; a different number of
+            # strips means the page height changed
+            change = None
+            if len(current_hashes) != len(baseline_hashes):
+                change = f"page height changed ({len(baseline_hashes)} -> {len(current_hashes)} screens)"
+            else:
+                distances = [hash_distance(baseline, current)
+                             for baseline, current in zip(baseline_hashes, current_hashes)]
+                changed = [i + 1 for i, distance in enumerate(distances) if distance > HASH_TOLERANCE_BITS]
+                if changed:
+                    change = (f"screen(s) {', '.join(map(str, changed))} changed "
+                              f"(up to {max(distances)} of {HASH_SIZE * HASH_SIZE} hash bits differ)")
+
+            if change:
+                current_path = self.current_dir / f"{name}.png"
+                self.ensure_dirs()
+                current_path.write_bytes(png_bytes)
 
-            if diff_percent > 5:
                 self.results["failed"] += 1
-                error = f"{test_name} FAILED: Visual change detected ({diff_percent:.1f}% difference)"
+                error = f"{test_name} FAILED: Visual change detected: {change}"
                 self.results["errors"].append(error)
                 self.log(error, "FAIL")
                 self.log(f"  Baseline: {baseline_path}", "INFO")
@@ -278,36 +507,28 @@ class VisualRegressionTester:
         self.log("=" * 60, "INFO")
         self.log("PERMITINDEX VISUAL REGRESSION TESTS", "INFO")
         self.log("=" * 60, "INFO")
+        self.flush_log()
 
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
-            page = browser.new_page(viewport={"width": 1920, "height": 1080})
-
-            # Test pages
-            test_pages = [
-                ("california/food-truck-operating-permit/", "food-truck-permit"),
-                ("california/business-license/", "business-license"),
-                ("california/contractor-license/", "contractor-license"),
-            ]
+            context = new_test_context(browser, self.base_url)
+            page = context.new_page()
 
-            for permit_url, name in test_pages:
+            for permit_url, name in TEST_PAGES:
                 self.log(f"\nTesting: {permit_url}", "INFO")
                 self.log("-" * 60, "INFO")
 
                 if test_mode == "baseline":
                     # Create baseline screenshots
-                    page.goto(f"{self.base_url}/{permit_url}")
-                    page.wait_for_load_state("networkidle")
-                    self.take_screenshot(page, name, baseline=True)
-                    self.log(f"Baseline screenshot saved: {name}", "PASS")
+                    try:
+                        self.load_page(page, permit_url)
+                        self.take_screenshot(page, name, baseline=True)
+                        self.log(f"Baseline screenshot saved: {name}", "PASS")
+                    finally:
+                        self.flush_log()
                 else:
-                    # Run functional tests
-                    self.test_timeline_numbering(page, permit_url)
-                    self.test_no_duplicate_elements(page, permit_url)
-                    self.test_visual_alignment(page, permit_url)
-
-                    # Run visual regression test
-                    self.test_visual_regression(page, permit_url, name)
+                    # Run functional and visual regression tests on a single page load
+                    self.check_permit_page(page, permit_url, name)
 
             browser.close()
 
@@ -322,10 +543,37 @@ class VisualRegressionTester:
             self.log("\nERRORS:", "FAIL")
             for error in self.results['errors']:
                 self.log(f"  - {error}", "FAIL")
+        self.flush_log()
 
         return self.results['failed'] == 0
 
 
+def pytest_generate_tests(metafunc):
+    """Run test_permit_page once per entry in TEST_PAGES (pytest only)"""
+    if "permit_page" in metafunc.fixturenames:
+        metafunc.parametrize("permit_page", TEST_PAGES, ids=[name for _, name in TEST_PAGES])
+
+
+def test_permit_page(browser, site_url, permit_page):
+    """
+    pytest entry point: functional and visual checks for one permit page
+
+    Each page is a separate test, so pytest-xdist can spread them across
+    workers (pytest -n auto); every worker gets its own session browser.
+    """
+    permit_url, name = permit_page
+    tester = VisualRegressionTester(base_url=site_url)
+    context = new_test_context(browser, site_url)
+    page = context.new_page()
+
+    try:
+        tester.check_permit_page(page, permit_url, name)
+    finally:
+        context.close()
+
+    assert tester.results["failed"] == 0, "; ".join(tester.results["errors"])
+
+
 def main():
     """Main entry point"""
     import argparse
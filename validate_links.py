@@ -7,40 +7,129 @@ Usage:
     python3 validate_links.py                    # Validate local build
     python3 validate_links.py --production       # Validate production site
     python3 validate_links.py --both             # Validate both
+    python3 validate_links.py --production --max-pages 100  # Crawl more pages
+    python3 validate_links.py --both --format junit > links.xml  # CI report
+    python3 validate_links.py --production --no-cache  # Ignore .link_cache.json
 """
 
 import os
 import re
+import mmap
 import sys
+import json
+import time
+import random
 import asyncio
+import argparse
+import posixpath
+import contextlib
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     from playwright.async_api import async_playwright
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
-    print("⚠️  Playwright not installed. Production validation disabled.")
-    print("   Install with: pip3 install playwright && playwright install chromium")
+    print("⚠️  Playwright not installed. Production validation disabled.", file=sys.stderr)
+    print("   Install with: pip3 install playwright && playwright install chromium", file=sys.stderr)
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    print("⚠️  aiohttp not installed. Production validation disabled.", file=sys.stderr)
+    print("   Install with: pip3 install aiohttp", file=sys.stderr)
+
+# Optional: aiodns resolves host names asynchronously with c-ares
+try:
+    import aiodns  # noqa: F401
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+# Optional: selectolax parses the pages instead of the href regex
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+# href attribute values, quoted or unquoted (used without selectolax); a bytes
+# pattern, so it can scan memory-mapped files without decoding them
+HREF_RE = re.compile(rb'href=(?:["\']([^"\']+)["\']|([^\s"\'>]+))')
+
+# Local hrefs that aren't links into the build: external links, anchors and
+# special protocols
+SKIP_LINK_PREFIXES = ('http://', 'https://', 'mailto:', 'tel:', '#', 'javascript:', 'data:', 'ftp:')
 
 # Configuration
 OUTPUT_DIR = "output"
 BASE_URL = "https://permitindex.com"
 
+# Local files are read and parsed in a process pool once the build has at
+# least this many; below that, worker start-up costs more than it saves
+PARALLEL_MIN_FILES = 200
+EXTRACT_CHUNK_SIZE = 32  # files per task sent to a worker
+INTERNAL_HOSTS = ['permitindex.com', 'www.permitindex.com']
+LINK_CHECK_TIMEOUT = 10  # seconds per link check
+MAX_CONCURRENT_CHECKS = 50  # link checks in flight at once
+MAX_CHECKS_PER_HOST = 4  # link checks in flight against a single host
+LINK_CHECK_ATTEMPTS = 3  # tries per link for transient failures
+MAX_RETRY_DELAY = 30  # seconds; caps the server's Retry-After
+RETRYABLE_STATUSES = {0, 429, 500, 502, 503, 504}  # 0 = connection error/timeout
+RANGE_FIRST_BYTE = {'Range': 'bytes=0-0'}  # GET fallback body limit
+KEEPALIVE_TIMEOUT = 30  # seconds an idle pooled connection is kept open
+DNS_CACHE_TTL = 600  # seconds a host name resolution is reused
+MAX_CRAWL_PAGES = 20  # default page limit of the production crawl (--max-pages)
+CRAWL_WORKERS = 4  # production pages rendered at once, one Playwright page each
+
+# Link check results are kept between runs; a link is checked again once its
+# result is older than the TTL for its status. Missing pages rarely come back,
+# so 404/410 are kept longest; server errors may be transient
+LINK_CACHE_FILE = ".link_cache.json"
+LINK_CACHE_TTLS = {  # seconds
+    200: 24 * 60 * 60,
+    404: 7 * 24 * 60 * 60,
+    410: 7 * 24 * 60 * 60,
+}
+LINK_CACHE_TTL_SERVER_ERROR = 60  # seconds, for 5xx and unreachable (0)
+LINK_CACHE_TTL_OTHER = 60 * 60  # seconds, for every other status
+
+
+def find_hrefs(html_content):
+    """
+    Find all href attribute values in HTML content
+
+    The content may be str, bytes or a bytes-like buffer such as an mmap;
+    only the matched values are decoded. With selectolax only real
+    attributes count, not href=... text inside comments or scripts.
+    """
+    if HTMLParser is not None:
+        if not isinstance(html_content, (str, bytes)):
+            html_content = bytes(html_content)
+        hrefs = [node.attributes['href'] for node in HTMLParser(html_content).css('[href]')]
+        return [href for href in hrefs if href]
+
+    if isinstance(html_content, str):
+        html_content = html_content.encode('utf-8')
+    return [(quoted or unquoted).decode('utf-8', 'replace')
+            for quoted, unquoted in HREF_RE.findall(html_content)]
+
 
 def extract_links_from_html(html_content, base_path=""):
-    """Extract all internal links from HTML content"""
+    """Extract all internal links from HTML content (str, bytes or mmap)"""
     links = set()
 
     # Find all href attributes
-    href_pattern = r'href=["\']([^"\']+)["\']'
-    matches = re.findall(href_pattern, html_content)
+    matches = find_hrefs(html_content)
 
     for match in matches:
         # Skip external links, anchors, and special protocols
-        if match.startswith(('http://', 'https://', 'mailto:', 'tel:', '#', 'javascript:')):
+        if match.startswith(SKIP_LINK_PREFIXES):
             continue
 
         # Normalize the link
@@ -56,8 +145,66 @@ def extract_links_from_html(html_content, base_path=""):
     return links
 
 
-def validate_local_links():
-    """Validate all internal links in the local build"""
+def extract_links_from_file(html_file, output_dir):
+    """
+    Read one built HTML file and extract its internal links
+
+    Returns (path relative to the output directory, set of links). Module
+    level so it can run in a process pool.
+    """
+    rel_path = Path(html_file).relative_to(output_dir)
+    base_path = f"/{rel_path.parent}/"
+
+    with open(html_file, 'rb') as f:
+        # The regex scans the page cache directly; selectolax parses the raw
+        # bytes itself. Empty files can't be mapped.
+        if HTMLParser is not None or os.fstat(f.fileno()).st_size == 0:
+            links = extract_links_from_html(f.read(), base_path)
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                links = extract_links_from_html(content, base_path)
+
+    return str(rel_path), links
+
+
+def link_candidates(link):
+    """
+    Output paths (relative, normalized) that a local link may refer to
+
+    A link ending in / is a directory's index.html; anything else may be a
+    file with or without extension, or a directory with index.html.
+    """
+    stripped = link.strip('/')
+    if link.endswith('/'):
+        candidates = (posixpath.join(stripped, "index.html"),)
+    else:
+        candidates = (stripped, stripped + '.html', posixpath.join(stripped, 'index.html'))
+    return tuple(posixpath.normpath(candidate) for candidate in candidates)
+
+
+def list_output_paths(output_dir):
+    """
+    Every file and directory under the output directory, as paths relative
+    to it with forward slashes
+
+    One directory walk replaces an exists() stat per link candidate.
+    """
+    paths = set()
+    for root, dirs, files in os.walk(output_dir):
+        rel_root = os.path.relpath(root, output_dir).replace(os.sep, '/')
+        prefix = '' if rel_root == '.' else rel_root + '/'
+        paths.update(prefix + name for name in dirs)
+        paths.update(prefix + name for name in files)
+    return paths
+
+
+def validate_local_links(report=None):
+    """
+    Validate all internal links in the local build
+
+    Broken links are also appended to report, if given, as
+    {'source', 'link', 'status'} dicts.
+    """
     print("=" * 80)
     print("🔍 LOCAL BUILD LINK VALIDATION")
     print("=" * 80)
@@ -73,55 +220,48 @@ def validate_local_links():
     html_files = list(output_path.glob("**/*.html"))
     print(f"📄 Found {len(html_files)} HTML files\n")
 
-    all_links = defaultdict(set)  # file -> set of links
+    link_valid = {}  # link -> whether it exists, resolved once per unique link
     broken_links = defaultdict(list)  # file -> list of broken links
-    all_found_links = set()
 
-    # Step 1: Extract all links from all files
+    # Step 1: Extract all links from all files, and
+    # Step 2: Validate each unique link once, reporting it for every file that
+    # contains it. With a process pool the two overlap: the workers extract
+    # links while this process lists the output tree and checks the links of
+    # the files already done.
     print("📊 Extracting links...")
-    for html_file in html_files:
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Get relative path from output dir for reporting
-        rel_path = html_file.relative_to(output_path)
-
-        # Extract links
-        links = extract_links_from_html(content, f"/{rel_path.parent}/")
-        all_links[str(rel_path)] = links
-        all_found_links.update(links)
-
-    print(f"   Found {len(all_found_links)} unique internal links\n")
-
-    # Step 2: Validate each link
-    print("🔍 Validating links...")
+    html_paths = [str(html_file) for html_file in html_files]
+    output_dirs = [OUTPUT_DIR] * len(html_paths)
     total_links_checked = 0
 
-    for source_file, links in all_links.items():
-        for link in links:
-            total_links_checked += 1
-
-            # Normalize link to file path
-            if link == '/':
-                file_path = output_path / "index.html"
-            elif link.endswith('/'):
-                file_path = output_path / link.strip('/') / "index.html"
-            else:
-                # Could be a file with extension or without
-                file_path = output_path / link.strip('/')
-                if not file_path.exists():
-                    # Try with .html extension
-                    file_path = output_path / (link.strip('/') + '.html')
-                if not file_path.exists():
-                    # Try as directory with index.html
-                    file_path = output_path / link.strip('/') / 'index.html'
-
-            # Check if file exists
-            if not file_path.exists():
-                broken_links[source_file].append(link)
-
+    with contextlib.ExitStack() as stack:
+        if len(html_paths) >= PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+            executor = stack.enter_context(ProcessPoolExecutor())
+            extracted = executor.map(extract_links_from_file, html_paths, output_dirs,
+                                     chunksize=EXTRACT_CHUNK_SIZE)
+        else:
+            extracted = map(extract_links_from_file, html_paths, output_dirs)
+
+        existing_paths = list_output_paths(output_path)
+
+        # Paths are relative to the output dir for reporting
+        for rel_path, links in extracted:
+            total_links_checked += len(links)
+            for link in links:
+                valid = link_valid.get(link)
+                if valid is None:
+                    # Check if file exists
+                    valid = link_valid[link] = not existing_paths.isdisjoint(link_candidates(link))
+                if not valid:
+                    broken_links[rel_path].append(link)
+
+    print(f"   Found {len(link_valid)} unique internal links\n")
+    print("🔍 Validating links...")
     print(f"   Checked {total_links_checked} total link references\n")
 
+    if report is not None:
+        report.extend({'source': source_file, 'link': link, 'status': None}
+                      for source_file, links in sorted(broken_links.items()) for link in sorted(links))
+
     # Step 3: Report results
     print("=" * 80)
     print("📊 VALIDATION RESULTS")
@@ -145,11 +285,149 @@ def validate_local_links():
         return False
 
 
-async def validate_production_links():
-    """Validate links on production site using Playwright"""
+async def request_status(session, url, request_headers=None):
+    """
+    Request a URL once with HTTP HEAD, falling back to GET when the server
+    rejects HEAD (403/405)
+
+    The GET asks for the first byte only (Range: bytes=0-0). A 206 Partial
+    Content or 304 Not Modified answer counts as 200. Returns (final status
+    after redirects, response headers); the status is 0 and the headers
+    empty if the request failed.
+    """
+    request_headers = request_headers or {}
+    try:
+        async with session.head(url, allow_redirects=True, headers=request_headers) as response:
+            status, headers = response.status, response.headers
+        if status in (403, 405):
+            async with session.get(url, allow_redirects=True,
+                                   headers={**request_headers, **RANGE_FIRST_BYTE}) as response:
+                status, headers = response.status, response.headers
+        if status in (206, 304):
+            status = 200
+        return status, headers
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return 0, {}
+
+
+async def check_link(session, url, global_sem, host_sems, previous=None):
+    """
+    Check that a URL exists; returns its link cache entry
+
+    The entry holds the HTTP status (0 if unreachable), the time of the
+    check and the response's ETag/Last-Modified validators. When the
+    previous entry for the URL has validators, the request is conditional
+    (If-None-Match/If-Modified-Since), so a server that supports them only
+    answers 304; servers that ignore them answer as usual.
+
+    Transient failures (RETRYABLE_STATUSES) are retried up to
+    LINK_CHECK_ATTEMPTS times with exponential backoff, honouring the
+    server's Retry-After header when it gives one in seconds.
+
+    At most MAX_CONCURRENT_CHECKS requests run at once, and at most
+    MAX_CHECKS_PER_HOST against the same host, so a burst of links to one
+    host isn't throttled (429/403) and reported as broken. The host slot is
+    taken first, so requests waiting on a busy host don't hold global slots
+    that other hosts could use. No slot is held while backing off.
+    """
+    conditional_headers = {}
+    if previous and previous['status'] == 200:
+        if previous.get('etag'):
+            conditional_headers['If-None-Match'] = previous['etag']
+        if previous.get('last_modified'):
+            conditional_headers['If-Modified-Since'] = previous['last_modified']
+
+    for attempt in range(LINK_CHECK_ATTEMPTS):
+        async with host_sems[urlparse(url).netloc], global_sem:
+            status, headers = await request_status(session, url, conditional_headers)
+
+        if status not in RETRYABLE_STATUSES or attempt == LINK_CHECK_ATTEMPTS - 1:
+            # A 304 may omit the validators; keep the ones it confirmed
+            return {
+                'status': status,
+                'ts': time.time(),
+                'etag': headers.get('ETag') or conditional_headers.get('If-None-Match'),
+                'last_modified': headers.get('Last-Modified') or conditional_headers.get('If-Modified-Since'),
+            }
+
+        retry_after = headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            delay = min(int(retry_after), MAX_RETRY_DELAY)
+        else:
+            delay = 2 ** attempt + random.random()
+        await asyncio.sleep(delay)
+
+
+def canonical_link(url):
+    """
+    Key identifying the resource a production link points to
+
+    Internal links become their path, without fragment, query, trailing
+    slash or trailing index.html, so /foo, /foo/, /foo/index.html and
+    https://permitindex.com/foo share one key; other links keep scheme,
+    lowercased host, path and query.
+    """
+    parsed = urlparse(url)
+    path = parsed.path
+    if path.endswith('/index.html'):
+        path = path[:-len('index.html')]
+    path = path.rstrip('/') or '/'
+
+    host = parsed.netloc.lower()
+    if not host or host in INTERNAL_HOSTS:
+        return path
+    query = f"?{parsed.query}" if parsed.query else ""
+    return f"{parsed.scheme}://{host}{path}{query}"
+
+
+def load_link_cache():
+    """Read the link check results saved by previous runs (URL -> entry)"""
+    try:
+        with open(LINK_CACHE_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_link_cache(link_cache):
+    """Save the link check results for the next run"""
+    tmp_path = LINK_CACHE_FILE + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(link_cache, f)
+    # Replace atomically so an interrupted run never leaves a partial file
+    os.replace(tmp_path, LINK_CACHE_FILE)
+
+
+def is_fresh(entry, now):
+    """Whether a link cache entry is recent enough to skip the check"""
+    status = entry['status']
+    if status in LINK_CACHE_TTLS:
+        ttl = LINK_CACHE_TTLS[status]
+    elif status == 0 or status >= 500:
+        ttl = LINK_CACHE_TTL_SERVER_ERROR
+    else:
+        ttl = LINK_CACHE_TTL_OTHER
+    return entry['ts'] + ttl > now
+
+
+async def validate_production_links(max_pages=MAX_CRAWL_PAGES, report=None, use_cache=True):
+    """
+    Validate links on production site
+
+    Pages are rendered with Playwright to discover their links; the links
+    themselves are checked concurrently with HTTP requests. CRAWL_WORKERS
+    pages are crawled at once from a shared queue, up to max_pages pages.
+
+    Broken links are also appended to report, if given, as
+    {'source', 'link', 'status'} dicts. Without use_cache every link is
+    checked again; the results still replace LINK_CACHE_FILE.
+    """
     if not PLAYWRIGHT_AVAILABLE:
         print("❌ Cannot validate production - Playwright not installed")
         return False
+    if not AIOHTTP_AVAILABLE:
+        print("❌ Cannot validate production - aiohttp not installed")
+        return False
 
     print("=" * 80)
     print("🌐 PRODUCTION SITE LINK VALIDATION")
@@ -158,79 +436,123 @@ async def validate_production_links():
 
     broken_links = defaultdict(list)  # page -> list of broken links
     visited_pages = set()
-    pages_to_visit = ['/']
-    link_to_status = {}  # link -> status code
-
-    async with async_playwright() as p:
+    queued_pages = {'/'}  # canonical links of every page ever put on the frontier
+    frontier = asyncio.Queue()
+    frontier.put_nowait('/')
+    link_to_status = {}  # canonical link -> status code
+    link_checks = {}  # canonical link -> task checking it, shared by every page linking to it
+    link_cache = load_link_cache() if use_cache else {}  # canonical URL -> result of the last check
+
+    # One connection pool for the whole crawl: connections are kept alive
+    # between pages, so each host's TCP/TLS handshake happens once, and host
+    # names are resolved once per run rather than every 10s (aiohttp's default)
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_CHECKS, limit_per_host=MAX_CHECKS_PER_HOST,
+                                     keepalive_timeout=KEEPALIVE_TIMEOUT,
+                                     use_dns_cache=True, ttl_dns_cache=DNS_CACHE_TTL,
+                                     resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None)
+    timeout = aiohttp.ClientTimeout(total=LINK_CHECK_TIMEOUT)
+    global_sem = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+    host_sems = defaultdict(lambda: asyncio.Semaphore(MAX_CHECKS_PER_HOST))
+
+    async def link_status(session, key, path):
+        """
+        Status of the link with canonical key, requested as path, unless a
+        previous run checked it recently
+        """
+        cache_key = urljoin(BASE_URL, key)
+        entry = link_cache.get(cache_key)
+        if not (entry and is_fresh(entry, time.time())):
+            entry = await check_link(session, urljoin(BASE_URL, path), global_sem, host_sems, previous=entry)
+            link_cache[cache_key] = entry
+        link_to_status[key] = entry['status']
+        return entry['status']
+
+    async def crawl_page(page, session, current_path):
+        """Render one page, check its links and queue the internal pages it links to"""
+        url = urljoin(BASE_URL, current_path)
+
+        try:
+            print(f"   Checking: {current_path}")
+            response = await page.goto(url, wait_until="networkidle", timeout=10000)
+
+            if response.status != 200:
+                print(f"   ⚠️  Page returned {response.status}")
+                return
+
+            # Extract all links from this page
+            links = await page.evaluate("""
+                () => {
+                    const links = Array.from(document.querySelectorAll('a[href]'));
+                    return links.map(a => a.href);
+                }
+            """)
+
+            # Only check internal links
+            link_paths = []
+            for link in links:
+                parsed = urlparse(link)
+                if parsed.netloc and parsed.netloc.lower() not in INTERNAL_HOSTS:
+                    continue
+                link_paths.append(parsed.path)
+
+            # Check every link on the page at once; a link already being
+            # checked for another page, in any spelling, is awaited rather
+            # than requested again
+            link_keys = {path: canonical_link(path) for path in link_paths}
+            for path, key in link_keys.items():
+                if key not in link_checks:
+                    link_checks[key] = asyncio.ensure_future(link_status(session, key, path))
+            unique_keys = list(dict.fromkeys(link_keys.values()))
+            statuses = dict(zip(unique_keys, await asyncio.gather(*(link_checks[key] for key in unique_keys))))
+
+            for link_path in link_paths:
+                key = link_keys[link_path]
+                if statuses[key] != 200:
+                    broken_links[current_path].append(link_path)
+                elif key not in queued_pages:
+                    # Add to pages to visit if it's an internal page
+                    if not link_path.endswith(('.xml', '.txt', '.json')):
+                        queued_pages.add(key)
+                        frontier.put_nowait(link_path)
+
+        except Exception as e:
+            print(f"   ❌ Error loading {current_path}: {str(e)}")
+
+    async def crawl_worker(page, session):
+        """Crawl pages from the frontier until the crawl is cancelled"""
+        while True:
+            current_path = await frontier.get()
+            try:
+                # The event loop is single-threaded, so the check and the add
+                # can't interleave with another worker
+                if len(visited_pages) < max_pages:
+                    visited_pages.add(current_path)
+                    await crawl_page(page, session, current_path)
+            finally:
+                frontier.task_done()
+
+    async with async_playwright() as p, \
+            aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
         browser = await p.chromium.launch(headless=True)
         context = await browser.new_context()
-        page = await context.new_page()
 
         print("🔍 Crawling site and checking links...")
 
-        while pages_to_visit and len(visited_pages) < 20:  # Limit to 20 pages for now
-            current_path = pages_to_visit.pop(0)
+        workers = [asyncio.create_task(crawl_worker(await context.new_page(), session))
+                   for _ in range(CRAWL_WORKERS)]
+        # Done once every queued page has been crawled or skipped
+        await frontier.join()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
 
-            if current_path in visited_pages:
-                continue
-
-            visited_pages.add(current_path)
-            url = urljoin(BASE_URL, current_path)
-
-            try:
-                print(f"   Checking: {current_path}")
-                response = await page.goto(url, wait_until="networkidle", timeout=10000)
-
-                if response.status != 200:
-                    print(f"   ⚠️  Page returned {response.status}")
-                    continue
+        await browser.close()
 
-                # Extract all links from this page
-                links = await page.evaluate("""
-                    () => {
-                        const links = Array.from(document.querySelectorAll('a[href]'));
-                        return links.map(a => a.href);
-                    }
-                """)
-
-                # Check each link
-                for link in links:
-                    parsed = urlparse(link)
-
-                    # Only check internal links
-                    if parsed.netloc and parsed.netloc not in ['permitindex.com', 'www.permitindex.com']:
-                        continue
-
-                    link_path = parsed.path
-
-                    # Skip if already checked
-                    if link_path in link_to_status:
-                        if link_to_status[link_path] != 200:
-                            broken_links[current_path].append(link_path)
-                        continue
-
-                    # Check if link works
-                    try:
-                        check_response = await page.goto(urljoin(BASE_URL, link_path),
-                                                        wait_until="domcontentloaded",
-                                                        timeout=5000)
-                        link_to_status[link_path] = check_response.status
-
-                        if check_response.status != 200:
-                            broken_links[current_path].append(link_path)
-                        else:
-                            # Add to pages to visit if it's an internal page
-                            if link_path not in visited_pages and link_path not in pages_to_visit:
-                                if not link_path.endswith(('.xml', '.txt', '.json')):
-                                    pages_to_visit.append(link_path)
-                    except Exception as e:
-                        broken_links[current_path].append(link_path)
-                        link_to_status[link_path] = 0
-
-            except Exception as e:
-                print(f"   ❌ Error loading {current_path}: {str(e)}")
+    save_link_cache(link_cache)
 
-        await browser.close()
+    if report is not None:
+        report.extend({'source': page, 'link': link, 'status': link_to_status.get(canonical_link(link))}
+                      for page, links in sorted(broken_links.items()) for link in sorted(set(links)))
 
     # Report results
     print()
@@ -253,33 +575,124 @@ async def validate_production_links():
         for page, links in sorted(broken_links.items()):
             print(f"📄 {page}")
             for link in sorted(set(links)):
-                status = link_to_status.get(link, 'unknown')
+                status = link_to_status.get(canonical_link(link), 'unknown')
                 print(f"   ❌ {link} (status: {status})")
             print()
 
         return False
 
 
+def write_json_report(results, stream):
+    """Write the validation results as one JSON document"""
+    json.dump({
+        'results': [
+            {
+                'name': name,
+                'status': {True: 'passed', False: 'failed', None: 'skipped'}[status],
+                'broken_links': broken,
+            }
+            for name, status, broken in results
+        ],
+    }, stream, indent=2)
+    stream.write('\n')
+
+
+def write_junit_report(results, stream):
+    """
+    Write the validation results as JUnit XML
+
+    Each validation is a test suite; every broken link is a failed test
+    case named after the link, in a class named after the page containing it.
+    """
+    testsuites = ET.Element('testsuites')
+    for name, status, broken in results:
+        suite = ET.SubElement(testsuites, 'testsuite', name=name)
+        if status is None:
+            case = ET.SubElement(suite, 'testcase', classname=name, name='links')
+            ET.SubElement(case, 'skipped', message='Not checked')
+        elif not broken:
+            case = ET.SubElement(suite, 'testcase', classname=name, name='links')
+            if status is False:
+                ET.SubElement(case, 'failure', message='Link validation failed')
+        for entry in broken:
+            case = ET.SubElement(suite, 'testcase', classname=entry['source'], name=entry['link'])
+            message = 'Broken link' if entry['status'] is None else f"Broken link (status: {entry['status']})"
+            ET.SubElement(case, 'failure', message=message)
+        suite.set('tests', str(len(suite)))
+        suite.set('failures', str(sum(case.find('failure') is not None for case in suite)))
+        suite.set('skipped', str(sum(case.find('skipped') is not None for case in suite)))
+    ET.ElementTree(testsuites).write(stream, encoding='unicode', xml_declaration=True)
+    stream.write('\n')
+
+
+REPORT_WRITERS = {'json': write_json_report, 'junit': write_junit_report}
+
+
 def main():
     """Main entry point"""
-    args = sys.argv[1:] if len(sys.argv) > 1 else []
-    mode = args[0] if args else '--local'
+    parser = argparse.ArgumentParser(description="Validate links in the local build and/or production site")
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument('--local', dest='mode', action='store_const', const='--local',
+                       help="Validate the local build (default)")
+    modes.add_argument('--production', dest='mode', action='store_const', const='--production',
+                       help="Validate the production site")
+    modes.add_argument('--both', dest='mode', action='store_const', const='--both',
+                       help="Validate both")
+    parser.add_argument('--max-pages', type=int, default=MAX_CRAWL_PAGES,
+                        help=f"Pages to crawl on the production site (default: {MAX_CRAWL_PAGES})")
+    parser.add_argument('--format', choices=['text', *REPORT_WRITERS], default='text',
+                        help="Output format; json and junit write a single report to stdout (default: text)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f"Recheck every production link instead of using {LINK_CACHE_FILE}")
+    parser.add_argument('--verbose', action='store_true',
+                        help="With --format json/junit, also show the text output (on stderr)")
+    parser.set_defaults(mode='--local')
+
+    args = parser.parse_args()
+    mode = args.mode
+
+    # With a machine-readable format, stdout carries only the report
+    with contextlib.ExitStack() as text_output:
+        if args.format != 'text':
+            target = sys.stderr if args.verbose else text_output.enter_context(open(os.devnull, 'w'))
+            text_output.enter_context(contextlib.redirect_stdout(target))
+        results = run_validations(mode, args.max_pages, use_cache=not args.no_cache)
+
+    if args.format != 'text':
+        REPORT_WRITERS[args.format](results, sys.stdout)
+
+    # Exit with error if any validation failed
+    if any(status is False for name, status, broken in results):
+        sys.exit(1)
+
+    sys.exit(0)
+
 
+def run_validations(mode, max_pages, use_cache=True):
+    """
+    Run the validations selected by mode and print a summary
+
+    Returns a list of (name, status, broken links) tuples; status is None
+    for a validation that couldn't run.
+    """
     results = []
 
     if mode in ['--local', '--both']:
         print()
-        local_ok = validate_local_links()
-        results.append(('Local Build', local_ok))
+        broken = []
+        local_ok = validate_local_links(report=broken)
+        results.append(('Local Build', local_ok, broken))
 
     if mode in ['--production', '--both']:
-        if PLAYWRIGHT_AVAILABLE:
+        if PLAYWRIGHT_AVAILABLE and AIOHTTP_AVAILABLE:
             print("\n" if mode == '--both' else "")
-            prod_ok = asyncio.run(validate_production_links())
-            results.append(('Production Site', prod_ok))
+            broken = []
+            prod_ok = asyncio.run(validate_production_links(max_pages=max_pages, report=broken,
+                                                            use_cache=use_cache))
+            results.append(('Production Site', prod_ok, broken))
         else:
-            print("\n❌ Skipping production validation (Playwright not available)")
-            results.append(('Production Site', None))
+            print("\n❌ Skipping production validation (Playwright or aiohttp not available)")
+            results.append(('Production Site', None, []))
 
     # Final summary
     if results:
@@ -287,7 +700,7 @@ def main():
         print("=" * 80)
         print("📊 FINAL SUMMARY")
         print("=" * 80)
-        for name, status in results:
+        for name, status, broken in results:
             if status is True:
                 print(f"✅ {name}: All links valid")
             elif status is False:
@@ -296,11 +709,7 @@ def main():
                 print(f"⚠️  {name}: Not checked")
         print("=" * 80)
 
-        # Exit with error if any validation failed
-        if any(status is False for name, status in results):
-            sys.exit(1)
-
-    sys.exit(0)
+    return results
 
 
 if __name__ == '__main__':
@@ -6,414 +6,505 @@ Tests deployed site at https://permitindex.com/
 
 import asyncio
 import json
+import sys
+from collections import Counter
 from playwright.async_api import async_playwright
+from pw_utils import launch_browser
 
 BASE_URL = "https://permitindex.com"
 
+# Pages the tests load; tests 3-13, 15, 16, 18 and 19 run on the permit page
+PERMIT_URL = f"{BASE_URL}/california/food-truck-operating-permit/"
+HUB_URL = f"{BASE_URL}/california/"
+SITEMAP_URL = f"{BASE_URL}/sitemap.xml"
+# The permit page's canonical link should point at itself
+EXPECTED_CANONICAL = PERMIT_URL
+
+# Subresources the SEO checks never look at; they aren't downloaded at all
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media'}
+
+# Report prefix for each result level
+LEVEL_ICONS = {'passed': "✅", 'failed': "❌", 'warnings': "⚠️ "}
+
+# Time limits in ms, well under Playwright's 30s default, so one stalled
+# page fails its tests instead of holding up the whole run
+NAVIGATION_TIMEOUT = 5000
+ACTION_TIMEOUT = 3000
+
+# Section headings the permit page tests look for, as (tag, text)
+EXPECTED_HEADINGS = [
+    ('h2', "Frequently Asked Questions"),
+    ('h2', "What People Are Saying"),
+    ('h2', "Tips from the Community"),
+    ('h2', "Common Mistakes"),
+    ('h3', "Contact Information"),
+    ('h3', "Value of Automation"),
+]
+
+# Everything the permit page tests inspect, read in one evaluate call instead
+# of a query per element; takes EXPECTED_HEADINGS. Missing elements are null.
+# headings maps each expected heading text to whether one h2/h3 walk found
+# it; like Playwright's has-text() the match is a case-insensitive substring
+PERMIT_PAGE_QUERY = """(expectedHeadings) => {
+    const attr = (selector, name) => {
+        const el = document.querySelector(selector);
+        return el ? (el.getAttribute(name) ?? '') : null;
+    };
+    const summary = document.querySelector('.bg-blue-50');
+    const breadcrumbs = document.querySelector('nav[aria-label="Breadcrumb"]');
+    const headings = Object.fromEntries(expectedHeadings.map(([, text]) => [text, false]));
+    document.querySelectorAll('h2, h3').forEach(el => {
+        const tag = el.tagName.toLowerCase();
+        const content = el.textContent.replace(/\\s+/g, ' ').trim().toLowerCase();
+        for (const [expectedTag, text] of expectedHeadings) {
+            if (tag === expectedTag && content.includes(text.toLowerCase())) headings[text] = true;
+        }
+    });
+    return {
+        canonical: attr('link[rel="canonical"]', 'href'),
+        metaDescription: attr('meta[name="description"]', 'content'),
+        h1s: Array.from(document.querySelectorAll('h1'), el => el.innerText),
+        summaryLength: summary ? summary.innerText.length : null,
+        h3Count: document.querySelectorAll('h3').length,
+        ldJson: Array.from(document.querySelectorAll('script[type="application/ld+json"]'), el => el.textContent),
+        headings,
+        hasPhone: !!document.querySelector('a[href^="tel:"]'),
+        hasEmail: !!document.querySelector('a[href^="mailto:"]'),
+        hasWtpSlider: !!document.querySelector('#wtpSlider'),
+        breadcrumbLinks: breadcrumbs ? breadcrumbs.querySelectorAll('a').length : null,
+        wordCount: (document.body.innerText.match(/\\S+/g) || []).length,
+        viewport: attr('meta[name="viewport"]', 'content'),
+    };
+}"""
+
+def loaded(result):
+    """Return a result gathered with return_exceptions=True, re-raising its failure"""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+def parse_ld_json(blocks):
+    """
+    Parse the page's JSON-LD blocks into a flat list of schema objects
+
+    Top-level arrays and @graph lists are expanded; blocks that aren't
+    valid JSON are skipped.
+    """
+    schemas = []
+    for block in blocks:
+        try:
+            data = json.loads(block)
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if not isinstance(item, dict):
+                continue
+            schemas.append(item)
+            schemas.extend(node for node in item.get('@graph', []) if isinstance(node, dict))
+    return schemas
+
+async def serve_from_cache(route, cache):
+    """
+    Route handler serving repeated subresource GETs from memory
+
+    The tabs load concurrently, so the first request for a URL fetches it
+    and any identical request made meanwhile waits for that fetch. Page
+    documents and non-200 responses always go to the network.
+    """
+    request = route.request
+    if request.method != 'GET' or request.resource_type == 'document':
+        await route.fallback()
+        return
+
+    url = request.url
+    pending = cache.get(url)
+    if pending is not None:
+        cached = await pending
+        if cached is None:
+            await route.fallback()
+        else:
+            status, headers, body = cached
+            await route.fulfill(status=status, headers=headers, body=body)
+        return
+
+    pending = cache[url] = asyncio.get_running_loop().create_future()
+    try:
+        response = await route.fetch()
+        body = await response.body()
+    except Exception:
+        del cache[url]
+        pending.set_result(None)
+        await route.fallback()
+        return
+
+    if response.status == 200:
+        pending.set_result((response.status, response.headers, body))
+    else:
+        del cache[url]
+        pending.set_result(None)
+    await route.fulfill(response=response, body=body)
+
+async def block_unneeded_resources(route):
+    """Route handler aborting BLOCKED_RESOURCE_TYPES requests"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.fallback()
+
 async def validate_seo():
     """Run comprehensive SEO validation tests"""
 
-    results = {
-        'passed': [],
-        'failed': [],
-        'warnings': []
-    }
+    results = []  # (level, message) per result, level being a LEVEL_ICONS key
+    output = []  # report lines, written to stdout in one go at the end
+
+    def record(level, msg):
+        """Add a test result to results and to the report"""
+        results.append((level, f"{LEVEL_ICONS[level]} {msg}"))
+        output.append(f"   {results[-1][1]}")
+
+    schemas_by_url = {}  # page URL -> its parsed JSON-LD schemas (parse_ld_json)
+    response_cache = {}  # subresource URL -> future of (status, headers, body)
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+        # A fresh context every run, so the checks see a first visit; routing
+        # requests disables Chromium's HTTP cache anyway, and repeated
+        # subresources come from response_cache instead
+        browser = await launch_browser(p)
         context = await browser.new_context()
-        page = await context.new_page()
+        context.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
+        context.set_default_timeout(ACTION_TIMEOUT)
+        await context.route("**/*", lambda route: serve_from_cache(route, response_cache))
+        # Registered last so it runs first; other requests fall back to the cache
+        await context.route("**/*", block_unneeded_resources)
 
         print("=" * 80)
         print("🔍 PERMITINDEX SEO VALIDATION")
         print("=" * 80)
         print(f"Testing: {BASE_URL}\n")
 
+        # Load every page the tests need at once, each in its own tab (the
+        # permit page is page). The checked markup is server-rendered, so
+        # there's no need to wait for analytics and other late requests to
+        # go idle
+        home_page, page, hub_page = [await context.new_page() for _ in range(3)]
+        home_response, permit_response, hub_response, sitemap_response = await asyncio.gather(
+            home_page.goto(BASE_URL, wait_until="domcontentloaded"),
+            page.goto(PERMIT_URL, wait_until="domcontentloaded"),
+            hub_page.goto(HUB_URL, wait_until="domcontentloaded"),
+            # The sitemap is only searched as text, so it's a plain HTTP GET
+            context.request.get(SITEMAP_URL, timeout=NAVIGATION_TIMEOUT),
+            return_exceptions=True
+        )
+
         # Test 1: Homepage loads
-        print("📄 Test 1: Homepage Accessibility")
+        output.append("📄 Test 1: Homepage Accessibility")
         try:
-            response = await page.goto(BASE_URL, wait_until="networkidle")
+            response = loaded(home_response)
             if response.status == 200:
-                results['passed'].append("✅ Homepage loads successfully (200 OK)")
-                print("   ✅ Homepage loads successfully (200 OK)")
+                record('passed', "Homepage loads successfully (200 OK)")
             else:
-                results['failed'].append(f"❌ Homepage returned status {response.status}")
-                print(f"   ❌ Homepage returned status {response.status}")
+                record('failed', f"Homepage returned status {response.status}")
         except Exception as e:
-            results['failed'].append(f"❌ Homepage failed to load: {str(e)}")
-            print(f"   ❌ Homepage failed to load: {str(e)}")
+            record('failed', f"Homepage failed to load: {str(e)}")
 
         # Test 2: Hierarchical URL Structure
-        print("\n📄 Test 2: URL Structure - Hierarchical Format")
-        permit_url = f"{BASE_URL}/california/food-truck-operating-permit/"
+        output.append("\n📄 Test 2: URL Structure - Hierarchical Format")
         try:
-            response = await page.goto(permit_url, wait_until="networkidle")
+            response = loaded(permit_response)
             if response.status == 200:
-                results['passed'].append(f"✅ Hierarchical URL works: {permit_url}")
-                print(f"   ✅ Hierarchical URL works: {permit_url}")
+                record('passed', f"Hierarchical URL works: {PERMIT_URL}")
             else:
-                results['failed'].append(f"❌ Permit page returned {response.status}")
-                print(f"   ❌ Permit page returned {response.status}")
+                record('failed', f"Permit page returned {response.status}")
         except Exception as e:
-            results['failed'].append(f"❌ Permit page failed: {str(e)}")
-            print(f"   ❌ Permit page failed: {str(e)}")
+            record('failed', f"Permit page failed: {str(e)}")
+
+        # Read the permit page DOM once for tests 3-13, 15, 16 and 18; if the
+        # page didn't load (e.g. timed out), they all fail with its error
+        if isinstance(permit_response, Exception):
+            permit_dom = permit_response
+        else:
+            try:
+                permit_dom = await page.evaluate(PERMIT_PAGE_QUERY, EXPECTED_HEADINGS)
+            except Exception as e:
+                permit_dom = e
 
         # Test 3: Canonical Tag
-        print("\n📄 Test 3: Canonical Tag Validation")
+        output.append("\n📄 Test 3: Canonical Tag Validation")
         try:
-            canonical = await page.query_selector('link[rel="canonical"]')
-            if canonical:
-                href = await canonical.get_attribute('href')
-                expected = f"{BASE_URL}/california/food-truck-operating-permit/"
-                if href == expected:
-                    results['passed'].append(f"✅ Canonical tag correct: {href}")
-                    print(f"   ✅ Canonical tag correct: {href}")
+            href = loaded(permit_dom)['canonical']
+            if href is not None:
+                if href == EXPECTED_CANONICAL:
+                    record('passed', f"Canonical tag correct: {href}")
                 else:
-                    results['failed'].append(f"❌ Canonical mismatch. Got: {href}, Expected: {expected}")
-                    print(f"   ❌ Canonical mismatch")
-                    print(f"      Got: {href}")
-                    print(f"      Expected: {expected}")
+                    record('failed', f"Canonical mismatch. Got: {href}, Expected: {EXPECTED_CANONICAL}")
             else:
-                results['failed'].append("❌ No canonical tag found")
-                print("   ❌ No canonical tag found")
+                record('failed', "No canonical tag found")
         except Exception as e:
-            results['failed'].append(f"❌ Canonical check failed: {str(e)}")
-            print(f"   ❌ Canonical check failed: {str(e)}")
+            record('failed', f"Canonical check failed: {str(e)}")
 
         # Test 4: Meta Description
-        print("\n📄 Test 4: Meta Description Quality")
+        output.append("\n📄 Test 4: Meta Description Quality")
         try:
-            meta_desc = await page.query_selector('meta[name="description"]')
-            if meta_desc:
-                content = await meta_desc.get_attribute('content')
+            content = loaded(permit_dom)['metaDescription']
+            if content is not None:
                 if content and len(content) > 100 and len(content) < 160:
-                    results['passed'].append(f"✅ Meta description optimal length: {len(content)} chars")
-                    print(f"   ✅ Meta description optimal length: {len(content)} chars")
-                    print(f"   📝 Content: {content[:80]}...")
+                    record('passed', f"Meta description optimal length: {len(content)} chars")
+                    output.append(f"   📝 Content: {content[:80]}...")
                 elif content:
-                    results['warnings'].append(f"⚠️  Meta description suboptimal: {len(content)} chars")
-                    print(f"   ⚠️  Meta description length: {len(content)} chars (ideal: 120-160)")
+                    record('warnings', f"Meta description suboptimal: {len(content)} chars (ideal: 120-160)")
                 else:
-                    results['failed'].append("❌ Meta description empty")
-                    print("   ❌ Meta description empty")
+                    record('failed', "Meta description empty")
             else:
-                results['failed'].append("❌ No meta description found")
-                print("   ❌ No meta description found")
+                record('failed', "No meta description found")
         except Exception as e:
-            results['failed'].append(f"❌ Meta description check failed: {str(e)}")
-            print(f"   ❌ Meta description check failed: {str(e)}")
+            record('failed', f"Meta description check failed: {str(e)}")
 
         # Test 5: H1 Tag
-        print("\n📄 Test 5: Heading Structure")
+        output.append("\n📄 Test 5: Heading Structure")
         try:
-            h1_elements = await page.query_selector_all('h1')
+            h1_elements = loaded(permit_dom)['h1s']
             if len(h1_elements) == 1:
-                h1_text = await h1_elements[0].inner_text()
-                results['passed'].append(f"✅ Exactly one H1 found: '{h1_text}'")
-                print(f"   ✅ Exactly one H1 found: '{h1_text}'")
+                h1_text = h1_elements[0]
+                record('passed', f"Exactly one H1 found: '{h1_text}'")
             elif len(h1_elements) == 0:
-                results['failed'].append("❌ No H1 tag found")
-                print("   ❌ No H1 tag found")
+                record('failed', "No H1 tag found")
             else:
-                results['warnings'].append(f"⚠️  Multiple H1 tags found: {len(h1_elements)}")
-                print(f"   ⚠️  Multiple H1 tags found: {len(h1_elements)}")
+                record('warnings', f"Multiple H1 tags found: {len(h1_elements)}")
         except Exception as e:
-            results['failed'].append(f"❌ H1 check failed: {str(e)}")
-            print(f"   ❌ H1 check failed: {str(e)}")
+            record('failed', f"H1 check failed: {str(e)}")
 
         # Test 6: Above-the-Fold Summary
-        print("\n📄 Test 6: Above-the-Fold Summary Section")
+        output.append("\n📄 Test 6: Above-the-Fold Summary Section")
         try:
-            summary = await page.query_selector('.bg-blue-50')
-            if summary:
-                text = await summary.inner_text()
-                if len(text) > 50:
-                    results['passed'].append(f"✅ Above-the-fold summary present: {len(text)} chars")
-                    print(f"   ✅ Above-the-fold summary present: {len(text)} chars")
+            summary_length = loaded(permit_dom)['summaryLength']
+            if summary_length is not None:
+                if summary_length > 50:
+                    record('passed', f"Above-the-fold summary present: {summary_length} chars")
                 else:
-                    results['warnings'].append("⚠️  Summary too short")
-                    print("   ⚠️  Summary too short")
+                    record('warnings', "Summary too short")
             else:
-                results['failed'].append("❌ No above-the-fold summary found")
-                print("   ❌ No above-the-fold summary found")
+                record('failed', "No above-the-fold summary found")
         except Exception as e:
-            results['warnings'].append(f"⚠️  Summary check failed: {str(e)}")
-            print(f"   ⚠️  Summary check failed: {str(e)}")
+            record('warnings', f"Summary check failed: {str(e)}")
 
         # Test 7: FAQ Section
-        print("\n📄 Test 7: FAQ Section Presence")
+        output.append("\n📄 Test 7: FAQ Section Presence")
         try:
-            faq_heading = await page.query_selector('h2:has-text("Frequently Asked Questions")')
-            if faq_heading:
+            dom = loaded(permit_dom)
+            if dom['headings']["Frequently Asked Questions"]:
                 # Count FAQ items
-                faq_items = await page.query_selector_all('h3')
-                faq_count = len([item for item in faq_items])
+                faq_count = dom['h3Count']
                 if faq_count >= 5:
-                    results['passed'].append(f"✅ FAQ section with {faq_count} questions")
-                    print(f"   ✅ FAQ section with {faq_count} questions")
+                    record('passed', f"FAQ section with {faq_count} questions")
                 else:
-                    results['warnings'].append(f"⚠️  Only {faq_count} FAQ items")
-                    print(f"   ⚠️  Only {faq_count} FAQ items")
+                    record('warnings', f"Only {faq_count} FAQ items")
             else:
-                results['failed'].append("❌ FAQ section not found")
-                print("   ❌ FAQ section not found")
+                record('failed', "FAQ section not found")
         except Exception as e:
-            results['warnings'].append(f"⚠️  FAQ check failed: {str(e)}")
-            print(f"   ⚠️  FAQ check failed: {str(e)}")
+            record('warnings', f"FAQ check failed: {str(e)}")
 
         # Test 8: FAQPage Schema
-        print("\n📄 Test 8: FAQPage Structured Data")
+        output.append("\n📄 Test 8: FAQPage Structured Data")
         try:
-            scripts = await page.query_selector_all('script[type="application/ld+json"]')
-            faq_schema_found = False
-            for script in scripts:
-                content = await script.inner_text()
-                try:
-                    data = json.loads(content)
-                    if data.get('@type') == 'FAQPage':
-                        faq_schema_found = True
-                        questions = data.get('mainEntity', [])
-                        results['passed'].append(f"✅ FAQPage schema with {len(questions)} questions")
-                        print(f"   ✅ FAQPage schema with {len(questions)} questions")
-                        break
-                except:
-                    continue
-
-            if not faq_schema_found:
-                results['failed'].append("❌ FAQPage schema not found")
-                print("   ❌ FAQPage schema not found")
+            if PERMIT_URL not in schemas_by_url:
+                schemas_by_url[PERMIT_URL] = parse_ld_json(loaded(permit_dom)['ldJson'])
+            faq_schema = next((schema for schema in schemas_by_url[PERMIT_URL]
+                               if schema.get('@type') == 'FAQPage'), None)
+
+            if faq_schema is not None:
+                questions = faq_schema.get('mainEntity', [])
+                record('passed', f"FAQPage schema with {len(questions)} questions")
+            else:
+                record('failed', "FAQPage schema not found")
         except Exception as e:
-            results['warnings'].append(f"⚠️  Schema check failed: {str(e)}")
-            print(f"   ⚠️  Schema check failed: {str(e)}")
+            record('warnings', f"Schema check failed: {str(e)}")
 
         # Test 9: Community Feedback Section
-        print("\n📄 Test 9: Community Feedback Section")
+        output.append("\n📄 Test 9: Community Feedback Section")
         try:
-            feedback_heading = await page.query_selector('h2:has-text("What People Are Saying")')
-            if feedback_heading:
-                results['passed'].append("✅ Community feedback section present")
-                print("   ✅ Community feedback section present")
+            if loaded(permit_dom)['headings']["What People Are Saying"]:
+                record('passed', "Community feedback section present")
             else:
-                results['warnings'].append("⚠️  Community feedback section not found")
-                print("   ⚠️  Community feedback section not found")
+                record('warnings', "Community feedback section not found")
         except Exception as e:
-            results['warnings'].append(f"⚠️  Feedback check failed: {str(e)}")
-            print(f"   ⚠️  Feedback check failed: {str(e)}")
+            record('warnings', f"Feedback check failed: {str(e)}")
 
         # Test 10: User Tips Section
-        print("\n📄 Test 10: User Tips Section")
+        output.append("\n📄 Test 10: User Tips Section")
         try:
-            tips_heading = await page.query_selector('h2:has-text("Tips from the Community")')
-            if tips_heading:
-                results['passed'].append("✅ User tips section present")
-                print("   ✅ User tips section present")
+            if loaded(permit_dom)['headings']["Tips from the Community"]:
+                record('passed', "User tips section present")
             else:
-                results['warnings'].append("⚠️  User tips section not found")
-                print("   ⚠️  User tips section not found")
+                record('warnings', "User tips section not found")
         except Exception as e:
-            results['warnings'].append(f"⚠️  Tips check failed: {str(e)}")
-            print(f"   ⚠️  Tips check failed: {str(e)}")
+            record('warnings', f"Tips check failed: {str(e)}")
 
         # Test 11: Common Mistakes Section
-        print("\n📄 Test 11: Common Mistakes Section")
+        output.append("\n📄 Test 11: Common Mistakes Section")
         try:
-            mistakes_heading = await page.query_selector('h2:has-text("Common Mistakes")')
-            if mistakes_heading:
-                results['passed'].append("✅ Common mistakes section present")
-                print("   ✅ Common mistakes section present")
+            if loaded(permit_dom)['headings']["Common Mistakes"]:
+                record('passed', "Common mistakes section present")
             else:
-                results['warnings'].append("⚠️  Common mistakes section not found")
-                print("   ⚠️  Common mistakes section not found")
+                record('warnings', "Common mistakes section not found")
         except Exception as e:
-            results['warnings'].append(f"⚠️  Mistakes check failed: {str(e)}")
-            print(f"   ⚠️  Mistakes check failed: {str(e)}")
+            record('warnings', f"Mistakes check failed: {str(e)}")
 
         # Test 12: Agency Contact Information
-        print("\n📄 Test 12: Agency Contact Information")
+        output.append("\n📄 Test 12: Agency Contact Information")
         try:
-            contact_heading = await page.query_selector('h3:has-text("Contact Information")')
-            if contact_heading:
+            dom = loaded(permit_dom)
+            if dom['headings']["Contact Information"]:
                 # Check for phone, email, address
-                phone = await page.query_selector('a[href^="tel:"]')
-                email = await page.query_selector('a[href^="mailto:"]')
-
                 contact_items = []
-                if phone:
+                if dom['hasPhone']:
                     contact_items.append("phone")
-                if email:
+                if dom['hasEmail']:
                     contact_items.append("email")
 
                 if contact_items:
-                    results['passed'].append(f"✅ Contact info present: {', '.join(contact_items)}")
-                    print(f"   ✅ Contact info present: {', '.join(contact_items)}")
+                    record('passed', f"Contact info present: {', '.join(contact_items)}")
                 else:
-                    results['warnings'].append("⚠️  Contact section exists but missing details")
-                    print("   ⚠️  Contact section exists but missing details")
+                    record('warnings', "Contact section exists but missing details")
             else:
-                results['warnings'].append("⚠️  Contact information section not found")
-                print("   ⚠️  Contact information section not found")
+                record('warnings', "Contact information section not found")
         except Exception as e:
-            results['warnings'].append(f"⚠️  Contact check failed: {str(e)}")
-            print(f"   ⚠️  Contact check failed: {str(e)}")
+            record('warnings', f"Contact check failed: {str(e)}")
 
         # Test 13: Willingness to Pay Widget
-        print("\n📄 Test 13: Willingness to Pay Widget")
+        output.append("\n📄 Test 13: Willingness to Pay Widget")
         try:
-            wtp_heading = await page.query_selector('h3:has-text("Value of Automation")')
-            wtp_slider = await page.query_selector('#wtpSlider')
+            dom = loaded(permit_dom)
+            wtp_heading = dom['headings']["Value of Automation"]
+            wtp_slider = dom['hasWtpSlider']
             if wtp_heading and wtp_slider:
-                results['passed'].append("✅ WTP widget present with slider")
-                print("   ✅ WTP widget present with slider")
+                record('passed', "WTP widget present with slider")
             elif wtp_heading:
-                results['warnings'].append("⚠️  WTP heading found but slider missing")
-                print("   ⚠️  WTP heading found but slider missing")
+                record('warnings', "WTP heading found but slider missing")
             else:
-                results['warnings'].append("⚠️  WTP widget not found")
-                print("   ⚠️  WTP widget not found")
+                record('warnings', "WTP widget not found")
         except Exception as e:
-            results['warnings'].append(f"⚠️  WTP check failed: {str(e)}")
-            print(f"   ⚠️  WTP check failed: {str(e)}")
+            record('warnings', f"WTP check failed: {str(e)}")
 
         # Test 14: Jurisdiction Hub Page
-        print("\n📄 Test 14: Jurisdiction Hub Page")
-        hub_url = f"{BASE_URL}/california/"
+        output.append("\n📄 Test 14: Jurisdiction Hub Page")
         try:
-            response = await page.goto(hub_url, wait_until="networkidle")
+            response = loaded(hub_response)
             if response.status == 200:
                 # Check for statistics
-                stats_present = await page.query_selector('text=/Total Permits/')
+                stats_present = await hub_page.locator('text=/Total Permits/').count() > 0
                 if stats_present:
-                    results['passed'].append(f"✅ Hub page exists with statistics: {hub_url}")
-                    print(f"   ✅ Hub page exists with statistics: {hub_url}")
+                    record('passed', f"Hub page exists with statistics: {HUB_URL}")
                 else:
-                    results['warnings'].append("⚠️  Hub page exists but missing statistics")
-                    print("   ⚠️  Hub page exists but missing statistics")
+                    record('warnings', "Hub page exists but missing statistics")
             else:
-                results['failed'].append(f"❌ Hub page returned {response.status}")
-                print(f"   ❌ Hub page returned {response.status}")
+                record('failed', f"Hub page returned {response.status}")
         except Exception as e:
-            results['failed'].append(f"❌ Hub page check failed: {str(e)}")
-            print(f"   ❌ Hub page check failed: {str(e)}")
+            record('failed', f"Hub page check failed: {str(e)}")
 
         # Test 15: Breadcrumbs
-        print("\n📄 Test 15: Breadcrumb Navigation")
-        await page.goto(permit_url, wait_until="networkidle")
+        output.append("\n📄 Test 15: Breadcrumb Navigation")
         try:
-            breadcrumbs = await page.query_selector('nav[aria-label="Breadcrumb"]')
-            if breadcrumbs:
+            link_count = loaded(permit_dom)['breadcrumbLinks']
+            if link_count is not None:
                 # Check for working links
-                links = await breadcrumbs.query_selector_all('a')
-                if len(links) >= 2:
-                    results['passed'].append(f"✅ Breadcrumbs present with {len(links)} links")
-                    print(f"   ✅ Breadcrumbs present with {len(links)} links")
+                if link_count >= 2:
+                    record('passed', f"Breadcrumbs present with {link_count} links")
                 else:
-                    results['warnings'].append("⚠️  Breadcrumbs incomplete")
-                    print("   ⚠️  Breadcrumbs incomplete")
+                    record('warnings', "Breadcrumbs incomplete")
             else:
-                results['failed'].append("❌ Breadcrumbs not found")
-                print("   ❌ Breadcrumbs not found")
+                record('failed', "Breadcrumbs not found")
         except Exception as e:
-            results['warnings'].append(f"⚠️  Breadcrumb check failed: {str(e)}")
-            print(f"   ⚠️  Breadcrumb check failed: {str(e)}")
+            record('warnings', f"Breadcrumb check failed: {str(e)}")
 
         # Test 16: Word Count (Visible Text)
-        print("\n📄 Test 16: Content Depth (Word Count)")
+        output.append("\n📄 Test 16: Content Depth (Word Count)")
         try:
-            # Get all text content
-            body = await page.query_selector('body')
-            text = await body.inner_text()
-            words = text.split()
-            word_count = len(words)
+            # Counted in the page, so the text itself never leaves the browser
+            word_count = loaded(permit_dom)['wordCount']
 
             if word_count >= 800:
-                results['passed'].append(f"✅ Excellent content depth: {word_count} words")
-                print(f"   ✅ Excellent content depth: {word_count} words")
+                record('passed', f"Excellent content depth: {word_count} words")
             elif word_count >= 500:
-                results['warnings'].append(f"⚠️  Moderate content: {word_count} words (target: 800+)")
-                print(f"   ⚠️  Moderate content: {word_count} words (target: 800+)")
+                record('warnings', f"Moderate content: {word_count} words (target: 800+)")
             else:
-                results['failed'].append(f"❌ Thin content: {word_count} words")
-                print(f"   ❌ Thin content: {word_count} words")
+                record('failed', f"Thin content: {word_count} words")
         except Exception as e:
-            results['warnings'].append(f"⚠️  Word count check failed: {str(e)}")
-            print(f"   ⚠️  Word count check failed: {str(e)}")
+            record('warnings', f"Word count check failed: {str(e)}")
 
         # Test 17: Sitemap
-        print("\n📄 Test 17: Sitemap Accessibility")
-        sitemap_url = f"{BASE_URL}/sitemap.xml"
+        output.append("\n📄 Test 17: Sitemap Accessibility")
         try:
-            response = await page.goto(sitemap_url, wait_until="networkidle")
+            response = loaded(sitemap_response)
             if response.status == 200:
-                content = await page.content()
-                if '<urlset' in content and permit_url in content:
-                    results['passed'].append(f"✅ Sitemap accessible and contains permit URLs")
-                    print(f"   ✅ Sitemap accessible and contains permit URLs")
+                # Searched as bytes; a large sitemap is never decoded
+                body = await response.body()
+                if b'<urlset' in body and PERMIT_URL.encode() in body:
+                    record('passed', "Sitemap accessible and contains permit URLs")
                 else:
-                    results['warnings'].append("⚠️  Sitemap exists but may be incomplete")
-                    print("   ⚠️  Sitemap exists but may be incomplete")
+                    record('warnings', "Sitemap exists but may be incomplete")
             else:
-                results['failed'].append(f"❌ Sitemap returned {response.status}")
-                print(f"   ❌ Sitemap returned {response.status}")
+                record('failed', f"Sitemap returned {response.status}")
         except Exception as e:
-            results['failed'].append(f"❌ Sitemap check failed: {str(e)}")
-            print(f"   ❌ Sitemap check failed: {str(e)}")
+            record('failed', f"Sitemap check failed: {str(e)}")
 
         # Test 18: Mobile Responsiveness
-        print("\n📄 Test 18: Mobile Responsiveness")
-        await page.goto(permit_url, wait_until="networkidle")
+        output.append("\n📄 Test 18: Mobile Responsiveness")
         try:
-            viewport_meta = await page.query_selector('meta[name="viewport"]')
-            if viewport_meta:
-                content = await viewport_meta.get_attribute('content')
+            content = loaded(permit_dom)['viewport']
+            if content is not None:
                 if 'width=device-width' in content:
-                    results['passed'].append("✅ Mobile viewport meta tag present")
-                    print("   ✅ Mobile viewport meta tag present")
+                    record('passed', "Mobile viewport meta tag present")
                 else:
-                    results['warnings'].append("⚠️  Viewport meta tag missing width=device-width")
-                    print("   ⚠️  Viewport meta tag missing width=device-width")
+                    record('warnings', "Viewport meta tag missing width=device-width")
+            else:
+                record('failed', "No viewport meta tag")
+        except Exception as e:
+            record('warnings', f"Mobile check failed: {str(e)}")
+
+        # Test 19: Indexability Headers
+        output.append("\n📄 Test 19: Indexability Headers")
+        try:
+            # Read off the permit page's navigation response; no extra request
+            robots = loaded(permit_response).headers.get('x-robots-tag', '')
+            if 'noindex' in robots.lower():
+                record('failed', f"Permit page sent X-Robots-Tag: {robots}")
             else:
-                results['failed'].append("❌ No viewport meta tag")
-                print("   ❌ No viewport meta tag")
+                record('passed', "Permit page is indexable (no X-Robots-Tag noindex)")
         except Exception as e:
-            results['warnings'].append(f"⚠️  Mobile check failed: {str(e)}")
-            print(f"   ⚠️  Mobile check failed: {str(e)}")
+            record('warnings', f"Header check failed: {str(e)}")
 
         await browser.close()
 
-    # Print Summary
-    print("\n" + "=" * 80)
-    print("📊 VALIDATION SUMMARY")
-    print("=" * 80)
-    print(f"✅ Passed: {len(results['passed'])}")
-    print(f"❌ Failed: {len(results['failed'])}")
-    print(f"⚠️  Warnings: {len(results['warnings'])}")
-    print()
-
-    if results['failed']:
-        print("❌ FAILED TESTS:")
-        for fail in results['failed']:
-            print(f"   {fail}")
-        print()
-
-    if results['warnings']:
-        print("⚠️  WARNINGS:")
-        for warning in results['warnings']:
-            print(f"   {warning}")
-        print()
+    # Summary
+    counts = Counter(level for level, _ in results)
+    output.append("\n" + "=" * 80)
+    output.append("📊 VALIDATION SUMMARY")
+    output.append("=" * 80)
+    output.append(f"✅ Passed: {counts['passed']}")
+    output.append(f"❌ Failed: {counts['failed']}")
+    output.append(f"⚠️  Warnings: {counts['warnings']}")
+    output.append("")
+
+    for level, heading in (('failed', "❌ FAILED TESTS:"), ('warnings', "⚠️  WARNINGS:")):
+        if counts[level]:
+            output.append(heading)
+            output.extend(f"   {msg}" for msg_level, msg in results if msg_level == level)
+            output.append("")
 
     # Overall result
-    if len(results['failed']) == 0:
-        print("🎉 ALL CRITICAL TESTS PASSED!")
-        if len(results['warnings']) == 0:
-            print("✨ PERFECT SCORE - No warnings!")
+    if counts['failed'] == 0:
+        output.append("🎉 ALL CRITICAL TESTS PASSED!")
+        if counts['warnings'] == 0:
+            output.append("✨ PERFECT SCORE - No warnings!")
         else:
-            print(f"💡 {len(results['warnings'])} minor improvements suggested")
+            output.append(f"💡 {counts['warnings']} minor improvements suggested")
     else:
-        print(f"⚠️  {len(results['failed'])} critical issues need attention")
+        output.append(f"⚠️  {counts['failed']} critical issues need attention")
 
-    print("=" * 80)
+    output.append("=" * 80)
+    sys.stdout.write("\n".join(output) + "\n")
 
-    return len(results['failed']) == 0
+    return counts['failed'] == 0
 
 if __name__ == '__main__':
     success = asyncio.run(validate_seo())
@@ -1,35 +1,117 @@
 #!/usr/bin/env python3
 """
 Simple script to view the generated HTML page in a browser
+
+Usage:
+    python3 view_page.py                # Open in the default browser
+    python3 view_page.py --pw           # Open in Playwright's Chromium
+    python3 view_page.py output/texas/index.html  # Open another page
 """
 
-from playwright.sync_api import sync_playwright
 import os
+import sys
+import asyncio
+import argparse
+import webbrowser
+
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+from pw_utils import launch_browser
+
+# The generated California Food Truck Permit page
+DEFAULT_HTML_FILE = 'output/california/california-food-truck-permit.html'
+
+def file_url_for(html_file):
+    """file:// URL of the HTML file"""
+    return f"file://{os.path.abspath(html_file)}"
+
+def watch_for_enter():
+    """
+    Start watching stdin for a line, without blocking the event loop
+
+    Returns a future resolved once Enter is pressed, or None if the event
+    loop can't watch stdin (Windows).
+    """
+    loop = asyncio.get_running_loop()
+    pressed = loop.create_future()
 
-def view_page(html_file):
-    """Open the HTML file in a browser"""
+    def on_input():
+        sys.stdin.readline()
+        if not pressed.done():
+            pressed.set_result(None)
 
-    # Get absolute path to the HTML file
-    abs_path = os.path.abspath(html_file)
-    file_url = f"file://{abs_path}"
+    try:
+        loop.add_reader(sys.stdin, on_input)
+    except NotImplementedError:
+        return None
+    # Stop watching once Enter is pressed, or the future is cancelled because
+    # the browser was closed first
+    pressed.add_done_callback(lambda _: loop.remove_reader(sys.stdin))
+    return pressed
 
+async def view_page_async(html_file):
+    """
+    Open the HTML file in a headed Chromium and wait until it's closed
+
+    Only the calling task waits, so the viewer can run alongside other work
+    in the same event loop. When stdin is a terminal, pressing Enter also
+    closes the browser.
+    """
+    if not PLAYWRIGHT_AVAILABLE:
+        print("❌ Playwright not installed", file=sys.stderr)
+        print("   Install with: pip3 install playwright && playwright install chromium", file=sys.stderr)
+        return
+
+    file_url = file_url_for(html_file)
     print(f"Opening: {file_url}")
 
-    with sync_playwright() as p:
+    async with async_playwright() as p:
         # Launch browser in headed mode (visible)
-        browser = p.chromium.launch(headless=False)
-        page = browser.new_page()
+        browser = await launch_browser(p, headless=False)
+        page = await browser.new_page()
 
         # Navigate to the file
-        page.goto(file_url)
+        await page.goto(file_url)
+
+        # Keep browser open until the page is closed (or Enter is pressed)
+        waiters = [asyncio.ensure_future(page.wait_for_event('close', timeout=0))]
+        enter_pressed = watch_for_enter() if sys.stdin.isatty() else None
+        if enter_pressed is not None:
+            waiters.append(enter_pressed)
+            print("\nBrowser is open. Close it or press Enter to finish...")
+        else:
+            print("\nBrowser is open. Close it to finish...")
+        _, pending = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in pending:
+            waiter.cancel()
 
-        # Keep browser open
-        print("\nBrowser is open. Press Enter to close...")
-        input()
+        await browser.close()
 
-        browser.close()
+def view_page(html_file, use_playwright=False):
+    """
+    Open the HTML file in a browser
+
+    By default the file is handed to the system's default browser, which
+    costs nothing to start. use_playwright launches a headed Chromium
+    instead (see view_page_async), for when devtools or scripting are needed.
+    """
+    if use_playwright:
+        asyncio.run(view_page_async(html_file))
+        return
+
+    file_url = file_url_for(html_file)
+    print(f"Opening: {file_url}")
+    webbrowser.open(file_url)
 
 if __name__ == '__main__':
-    # View the generated California Food Truck Permit page
-    html_file = 'output/california/california-food-truck-permit.html'
-    view_page(html_file)
+    parser = argparse.ArgumentParser(description="View a generated page in a browser")
+    parser.add_argument('html_file', nargs='?', default=DEFAULT_HTML_FILE,
+                        help=f"HTML file to open (default: {DEFAULT_HTML_FILE})")
+    parser.add_argument('--pw', action='store_true',
+                        help="open in Playwright's Chromium instead of the default browser")
+    args = parser.parse_args()
+    view_page(args.html_file, use_playwright=args.pw)